@@ -1,14 +1,22 @@
 import logging
 import os
+from functools import lru_cache
 
 import dash
 import dash_bootstrap_components as dbc
-from dash import callback, dcc, html
+from dash import callback, dcc, html, no_update
+from dash.exceptions import PreventUpdate
 from dash.dependencies import Input, Output, State
 from flask import Flask
 
 
 import components.data  # Import data module to register callbacks
+from components.common.active_tab import refresh_store_id
+from components.common.background import init_background
+from components.common.compression import init_compression
+from components.common.filter_slider import create_filter_slider
+from components.common.year_slider import create_year_slider, year_marks
+from components.common.serialization import install_serializer
 from components.sidebar import create_sidebar
 from components.tabs.geo_eco import create_geo_eco_tab
 from components.tabs.healthcare import create_healthcare_tab
@@ -34,7 +42,10 @@ logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 
+install_serializer()
 server = Flask(__name__)
+init_compression(server)
+init_background(server)
 app = dash.Dash(
     __name__,
     server=server,
@@ -51,6 +62,33 @@ application = app.server
 # )
 
 
+# Tab layout factories in navbar order; tab-store records tabs by these names
+TAB_FACTORIES = {
+    "introduction": create_introduction_tab,
+    "world-map": create_world_map_tab,
+    "geo-eco": create_geo_eco_tab,
+    "healthcare": create_healthcare_tab,
+    "trends": create_trends_tab,
+}
+TAB_NAMES = list(TAB_FACTORIES)
+# Year range of the shared year slider per tab; tabs not listed hide it
+YEAR_SLIDER_RANGES = {
+    "world-map": (1980, 2021),
+    "geo-eco": (1990, 2021),
+    "healthcare": (1980, 2021),
+}
+# Tabs that show the shared top-N filter slider
+TOP_FILTER_TABS = {"geo-eco", "healthcare"}
+HIDDEN = {"display": "none"}
+YEAR_SLIDER_STYLE = {"height": "50px", "marginTop": "2px"}
+
+
+@lru_cache(maxsize=None)
+def get_tab_layout(name):
+    """Build a tab's layout once; the static tree is reused for every session."""
+    return TAB_FACTORIES[name]()
+
+
 navbar = dbc.Navbar(
     dbc.Container(
         [
@@ -100,7 +138,25 @@ app.layout = html.Div(
                                 dcc.Store(id="tab-store", data={}),
                                 color="primary",
                             ),
-                            html.Div(id="tab-content"),
+                            *[dcc.Store(id=refresh_store_id(name)) for name in TAB_NAMES],
+                            html.Div(
+                                create_filter_slider(),
+                                id="top-filter-container",
+                                className="mb-3",
+                                style=HIDDEN,
+                            ),
+                            html.Div(
+                                [
+                                    html.Div(id=f"tab-{i}-pane", style=HIDDEN)
+                                    for i in range(len(TAB_NAMES))
+                                ],
+                                id="tab-content",
+                            ),
+                            html.Div(
+                                create_year_slider(),
+                                id="year-slider-container",
+                                style=HIDDEN,
+                            ),
                         ],
                         style={
                             "padding": "20px",
@@ -133,30 +189,92 @@ def update_active_tab(*args):
     return [f"tab-{i}-link" == clicked_tab for i in range(5)]
 
 
-# Callback to update tab content
+# Callback to update tab content: a tab's layout is rendered the first time it
+# is opened and then stays mounted, hidden with CSS while another tab is active.
+# A mounted tab that missed a control change while hidden is refreshed on opening.
 @app.callback(
-    Output("tab-content", "children"),
-    [Input(f"tab-{i}-link", "active") for i in range(5)],
-    [State("tab-store", "data")],
+    output=[Output(f"tab-{i}-pane", "children") for i in range(len(TAB_NAMES))]
+    + [Output(f"tab-{i}-pane", "style") for i in range(len(TAB_NAMES))]
+    + [Output(refresh_store_id(name), "data") for name in TAB_NAMES]
+    + [Output("tab-store", "data")],
+    inputs=[Input(f"tab-{i}-link", "active") for i in range(len(TAB_NAMES))],
+    state=[State("tab-store", "data")],
 )
-def render_tab_content(*active_tabs):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return create_introduction_tab()
-
-    tab_mapping = {
-        0: create_introduction_tab,
-        1: create_world_map_tab,
-        2: create_geo_eco_tab,
-        3: create_healthcare_tab,
-        4: create_trends_tab,
+def render_tab_content(*args):
+    *active_tabs, tab_store = args
+    tab_store = tab_store or {}
+    active = TAB_NAMES[active_tabs.index(True)] if True in active_tabs else TAB_NAMES[0]
+    mounted = set(tab_store.get("mounted", []))
+    stale = set(tab_store.get("stale", []))
+    refreshes = tab_store.get("refreshes", 0) + (active in stale)
+
+    children = [
+        get_tab_layout(name) if name == active and name not in mounted else no_update
+        for name in TAB_NAMES
+    ]
+    styles = [None if name == active else HIDDEN for name in TAB_NAMES]
+    refresh = [refreshes if name == active and name in stale else no_update for name in TAB_NAMES]
+    store = {
+        "active": active,
+        "mounted": sorted(mounted | {active}),
+        "stale": sorted(stale - {active}),
+        "refreshes": refreshes,
     }
+    return children + styles + refresh + [store]
+
+
+# Callback to flag the hidden mounted tabs as stale when a shared control changes
+@app.callback(
+    Output("tab-store", "data", allow_duplicate=True),
+    Input("year-slider", "value"),
+    Input("region-dropdown", "value"),
+    Input("income-dropdown", "value"),
+    Input("gender-dropdown", "value"),
+    Input("metric-dropdown", "value"),
+    Input("age-dropdown", "value"),
+    Input("country-dropdown", "value"),
+    Input("top-filter-slider", "value"),
+    State("tab-store", "data"),
+    prevent_initial_call=True,
+)
+def mark_hidden_tabs_stale(*args):
+    *_, tab_store = args
+    tab_store = tab_store or {}
+    hidden = set(tab_store.get("mounted", [])) - {tab_store.get("active")}
+    stale = set(tab_store.get("stale", []))
+    if hidden <= stale:
+        raise PreventUpdate
+    return {**tab_store, "stale": sorted(stale | hidden)}
 
-    for i, is_active in enumerate(active_tabs):
-        if is_active:
-            return tab_mapping[i]()
 
-    return "No tab selected"
+# Callback to show the shared sliders on the tabs that use them
+@app.callback(
+    Output("top-filter-container", "style"),
+    Output("year-slider-container", "style"),
+    Output("year-slider", "min"),
+    Output("year-slider", "max"),
+    Output("year-slider", "marks"),
+    Output("year-slider", "value", allow_duplicate=True),
+    Input("tab-store", "data"),
+    State("year-slider", "value"),
+    prevent_initial_call="initial_duplicate",
+)
+def configure_shared_controls(tab_store, year):
+    active = (tab_store or {}).get("active")
+    if active not in YEAR_SLIDER_RANGES:
+        return HIDDEN, HIDDEN, no_update, no_update, no_update, no_update
+    min_year, max_year = YEAR_SLIDER_RANGES[active]
+    filter_style = None if active in TOP_FILTER_TABS else HIDDEN
+    # Keep the selected year inside the range of the tab being shown
+    clamped = max_year if year is None else min(max(year, min_year), max_year)
+    return (
+        filter_style,
+        YEAR_SLIDER_STYLE,
+        min_year,
+        max_year,
+        year_marks(min_year, max_year),
+        no_update if clamped == year else clamped,
+    )
 
 
 # Add callback to toggle navbar
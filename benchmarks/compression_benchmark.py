@@ -0,0 +1,56 @@
+"""Benchmark response compression on typical callback payloads.
+
+Builds the default choropleth, GEO-ECO, healthcare and trends callback responses,
+serializes them the way Dash does, and reports compression time against bytes
+saved for several gzip levels and brotli qualities.
+
+Run from the repository root:
+
+    python -m benchmarks.compression_benchmark
+"""
+
+import statistics
+import time
+
+from plotly.io.json import to_json_plotly
+
+from benchmarks.payloads import callback_response, typical_outputs
+from components.common.compression import brotli, compress
+
+REPEATS = 20
+
+
+def typical_payloads():
+    """Serialized callback responses, the bytes the compressor actually sees."""
+    return {
+        name: to_json_plotly(callback_response(*output)).encode()
+        for name, output in typical_outputs().items()
+    }
+
+
+def settings():
+    for level in (1, 6, 9):
+        yield f"gzip-{level}", "gzip", {"level": level}
+    if brotli is not None:
+        for quality in (1, 4, 6, 11):
+            yield f"br-{quality}", "br", {"quality": quality}
+
+
+def main():
+    print(f"{'payload':<18}{'setting':<10}{'raw kB':>10}{'out kB':>10}{'saved %':>10}{'ms':>10}")
+    for name, data in typical_payloads().items():
+        for label, encoding, options in settings():
+            timings = []
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                compressed = compress(data, encoding, **options)
+                timings.append(time.perf_counter() - start)
+            print(
+                f"{name:<18}{label:<10}{len(data) / 1024:>10.1f}{len(compressed) / 1024:>10.1f}"
+                f"{100 * (1 - len(compressed) / len(data)):>10.1f}"
+                f"{statistics.median(timings) * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Typical callback outputs for the default dashboard selection, shared by the benchmarks.
+
+Each output comes with a function that runs its callback with the figure cache
+emptied first, so every call builds the figure instead of returning a cache hit.
+"""
+
+from dash import Patch
+
+from components.data.data import (
+    get_geo_eco_data,
+    get_healthcare_data,
+    get_sankey_data,
+    get_trends_data,
+    get_world_map_data,
+)
+from components.data.figure_cache import FIGURE_CACHE
+from components.tabs.geo_eco import (
+    create_geo_eco_bar,
+    create_geo_eco_histogram,
+    create_geo_eco_sankey,
+    create_geo_eco_scatter,
+)
+from components.tabs.healthcare import (
+    create_blood_pressure_plot,
+    create_gender_comparison_plot,
+    create_obesity_plot,
+    create_risk_corr_plot,
+)
+from components.tabs.trends import update_trend_plots
+from components.tabs.world_map import update_map
+
+YEAR, GENDER, METRIC, AGE, TOP_N = 2019, "Both", "Death Rate", "Age-standardized", 10
+# The static map for one year; the animation switch is off by default
+ANIMATED = False
+
+
+def uncached(callback, *args):
+    """Return a function running callback(*args) on an empty figure cache."""
+
+    def build():
+        FIGURE_CACHE.clear()
+        return callback(*args)
+
+    return build
+
+
+def first_output(build):
+    """Keep only the first output of a multi-output callback."""
+    return lambda: build()[0]
+
+
+def sent_update(build):
+    """Return the first output as Dash puts it in the response: patch operations or a figure."""
+
+    def update():
+        value = build()[0]
+        return value.to_plotly_json() if isinstance(value, Patch) else value
+
+    return update
+
+
+def typical_builds():
+    """Return {name: (output id, property, build)} for the output of each tab."""
+    world_map = get_world_map_data(YEAR, None, None, GENDER, METRIC, AGE)
+    # Moving the slider on by a year sends the map as a patch against this signature
+    next_world_map = get_world_map_data(YEAR - 1, None, None, GENDER, METRIC, AGE)
+    _, map_signature = update_map(world_map, METRIC, GENDER, ANIMATED, None)
+    geo_eco = get_geo_eco_data(YEAR, None, None, GENDER, METRIC, AGE, None)
+    sankey = get_sankey_data(None, None, GENDER, METRIC)
+    healthcare = get_healthcare_data(YEAR, None, None, GENDER, METRIC, AGE, None)
+    trends = get_trends_data(METRIC, GENDER)
+    return {
+        "choropleth": (
+            "chloropleth-map",
+            "figure",
+            first_output(uncached(update_map, world_map, METRIC, GENDER, ANIMATED, None)),
+        ),
+        "choropleth patch": (
+            "chloropleth-map",
+            "figure",
+            sent_update(
+                uncached(update_map, next_world_map, METRIC, GENDER, ANIMATED, map_signature)
+            ),
+        ),
+        "geo-eco scatter": (
+            "geo-eco-scatter",
+            "figure",
+            uncached(create_geo_eco_scatter, geo_eco, METRIC, GENDER, TOP_N),
+        ),
+        "geo-eco hist": (
+            "geo-eco-histogram",
+            "figure",
+            uncached(create_geo_eco_histogram, geo_eco, METRIC, GENDER),
+        ),
+        "geo-eco bar": (
+            "geo-eco-bar",
+            "figure",
+            uncached(create_geo_eco_bar, geo_eco, METRIC, GENDER, TOP_N),
+        ),
+        "geo-eco sankey": (
+            "geo-eco-sankey",
+            "figure",
+            uncached(create_geo_eco_sankey, sankey, METRIC, GENDER),
+        ),
+        "hc obesity": (
+            "healthcare-obesity",
+            "figure",
+            uncached(create_obesity_plot, healthcare, GENDER, METRIC, TOP_N),
+        ),
+        "hc risk corr": (
+            "healthcare-risk-corr",
+            "figure",
+            uncached(create_risk_corr_plot, GENDER, METRIC),
+        ),
+        "hc blood press": (
+            "healthcare-blood-pressure",
+            "figure",
+            uncached(create_blood_pressure_plot, GENDER, METRIC),
+        ),
+        "hc gender comp": (
+            "healthcare-gender-comparison",
+            "figure",
+            uncached(create_gender_comparison_plot, healthcare, METRIC, TOP_N),
+        ),
+        "trends": (
+            "trend-plots",
+            "children",
+            uncached(update_trend_plots, trends, METRIC, GENDER),
+        ),
+    }
+
+
+def typical_outputs():
+    """Return {name: (output id, property, value)} for the output of each tab."""
+    return {
+        name: (output_id, prop, build())
+        for name, (output_id, prop, build) in typical_builds().items()
+    }
+
+
+def callback_response(output_id, prop, value):
+    """Wrap an output the way Dash's _dash-update-component response does."""
+    return {"multi": True, "response": {output_id: {prop: value}}}
@@ -0,0 +1,79 @@
+"""Benchmark the JSON serializers on the outputs each tab produces.
+
+Compares Plotly's json engine, Plotly's orjson engine and the orjson
+serializer from components.common.serialization on the default callback
+responses. Every timed iteration rebuilds the response with the figure cache
+emptied, and reports the build time next to the serialization time. It also
+checks that every serializer decodes to the same document, up to float32
+precision: orjson writes numpy float32 scalars at their own precision rather
+than widened to float64.
+
+Run from the repository root:
+
+    python -m benchmarks.serialization_benchmark
+"""
+
+import json
+import statistics
+import time
+
+import plotly.io.json as plotly_json
+
+from benchmarks.payloads import callback_response, typical_builds
+from components.common.serialization import _plotly_to_json, orjson, to_json_fast
+
+REPEATS = 20
+
+
+def normalize(value):
+    """Round floats so float32 scalars written at float32 precision compare equal."""
+    if isinstance(value, float):
+        return float(f"{value:.6g}")
+    if isinstance(value, dict):
+        return {key: normalize(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+    return value
+
+
+def serializers():
+    yield "plotly-json", lambda obj: _plotly_to_json(obj, engine="json")
+    if orjson is not None:
+        yield "plotly-orjson", lambda obj: _plotly_to_json(obj, engine="orjson")
+        yield "fast-orjson", to_json_fast
+
+
+def main():
+    # Build the outputs with the stock Plotly serializer in place
+    plotly_json.to_json_plotly = _plotly_to_json
+
+    print(f"{'payload':<18}{'serializer':<15}{'kB':>10}{'build ms':>10}{'ms':>10}{'speedup':>10}")
+    for name, (output_id, prop, build) in typical_builds().items():
+        # Serializers are compared on one response: rebuilt figures may order traces differently
+        sample = callback_response(output_id, prop, build())
+        reference = None
+        baseline = None
+        for label, serialize in serializers():
+            build_timings = []
+            timings = []
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                response = callback_response(output_id, prop, build())
+                built = time.perf_counter()
+                encoded = serialize(response)
+                build_timings.append(built - start)
+                timings.append(time.perf_counter() - built)
+            median = statistics.median(timings)
+            baseline = baseline or median
+            decoded = normalize(json.loads(serialize(sample)))
+            reference = reference or decoded
+            match = "" if decoded == reference else "  MISMATCH"
+            print(
+                f"{name:<18}{label:<15}{len(encoded) / 1024:>10.1f}"
+                f"{statistics.median(build_timings) * 1000:>10.2f}{median * 1000:>10.2f}"
+                f"{baseline / median:>9.1f}x{match}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Callbacks that only run while their tab is showing.
+
+Visited tabs stay mounted and are hidden with CSS, so their callbacks would
+still fire on every change of the shared sidebar controls and sliders. A
+``tab_callback`` reads ``tab-store`` and skips the update unless its tab is the
+active one. ``tab-store`` lists the hidden tabs that missed such a change as
+stale; opening a stale tab bumps its refresh Store, which runs its callbacks
+once more. Opening a tab that is up to date costs nothing on the server.
+"""
+
+from functools import wraps
+
+from dash import Input, State, callback
+from dash.exceptions import PreventUpdate
+
+
+def refresh_store_id(tab):
+    """Id of the Store bumped to re-run a stale tab's callbacks."""
+    return f"{tab}-refresh"
+
+
+def is_active(tab_store, tab):
+    """Whether tab is the one shown according to the tab-store data."""
+    return (tab_store or {}).get("active") == tab
+
+
+def tab_callback(tab, *dependencies, **kwargs):
+    """Register the decorated function as a callback gated on tab being active.
+
+    Takes the same dependencies and keyword arguments as ``dash.callback``. The
+    function is returned unchanged, so it can still be called directly with its
+    own arguments.
+    """
+    # Dash passes all inputs before the states; the refresh Store is the last input
+    refresh_index = sum(isinstance(dep, Input) for dep in dependencies)
+
+    def decorator(func):
+        @wraps(func)
+        def gated(*args):
+            *args, tab_store = args
+            if not is_active(tab_store, tab):
+                raise PreventUpdate
+            return func(*args[:refresh_index], *args[refresh_index + 1 :])
+
+        callback(
+            *dependencies,
+            Input(refresh_store_id(tab), "data"),
+            State("tab-store", "data"),
+            **kwargs,
+        )(gated)
+        return func
+
+    return decorator
@@ -0,0 +1,130 @@
+"""Background execution for the heavy plot callbacks.
+
+When ``BACKGROUND_CALLBACKS`` is enabled, the figure builders decorated with
+``offloaded`` run on a pool of long-lived worker processes instead of the
+request thread, so they no longer contend for the web worker's GIL. The
+workers are spawned rather than forked, because Polars' thread pool does not
+survive a fork. Each worker imports the builders and loads the data snapshot
+once, then serves jobs from memory.
+
+Every browser gets a ``client_id`` cookie. When a client sends new inputs to
+the same callback, its superseded job is cancelled if it is still queued.
+If the job is already running, its result is dropped and the stale request
+returns without an update. The pool and the record of each client's latest
+job belong to one process, so gunicorn.conf.py runs a single worker with
+several threads in this mode: a new request can then arrive while an older one
+is still waiting, and only BACKGROUND_WORKERS processes are spawned in total.
+"""
+
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor, TimeoutError
+from functools import wraps
+
+import plotly.io.json as plotly_json
+from dash.exceptions import PreventUpdate
+from flask import has_request_context, request
+
+logger = logging.getLogger(__name__)
+
+BACKGROUND_CALLBACKS = os.getenv("BACKGROUND_CALLBACKS", "false").lower() in ("1", "true", "yes")
+BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "2"))
+CLIENT_COOKIE = "client_id"
+# Seconds between checks of whether a waiting request has been superseded
+POLL_INTERVAL = 0.05
+
+# Offloaded builders by "module:qualname", registered on import in every process
+BUILDERS = {}
+
+_pool = None
+_pool_lock = threading.Lock()
+# Latest job per (builder, client), so a newer request can supersede it
+_latest = {}
+_latest_lock = threading.Lock()
+
+
+def get_pool():
+    """Start the worker pool on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=BACKGROUND_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info("Started %d background workers", BACKGROUND_WORKERS)
+        return _pool
+
+
+def run_builder(name, args):
+    """Worker-side entry point: build a figure and return it encoded as JSON."""
+    module, _ = name.split(":")
+    importlib.import_module(module)
+    return plotly_json.to_json_plotly(BUILDERS[name](*args))
+
+
+def client_id():
+    """Return the id of the browser sending the current request, if any."""
+    if not has_request_context():
+        return None
+    return request.cookies.get(CLIENT_COOKIE)
+
+
+def offloaded(func):
+    """Run a figure builder in the worker pool when background callbacks are on.
+
+    Calls from outside a Dash request, such as prefetching, run inline. The
+    builder's output comes back as a JSON-ready dict.
+    """
+    name = f"{func.__module__}:{func.__qualname__}"
+    BUILDERS[name] = func
+
+    @wraps(func)
+    def wrapper(*args):
+        client = client_id()
+        if not BACKGROUND_CALLBACKS or client is None:
+            return func(*args)
+
+        future = get_pool().submit(run_builder, name, args)
+        slot = (name, client)
+        with _latest_lock:
+            superseded = _latest.get(slot)
+            _latest[slot] = future
+        if superseded is not None and superseded.cancel():
+            logger.debug("Cancelled queued %s job for client %s", name, client)
+
+        try:
+            while True:
+                try:
+                    return json.loads(future.result(timeout=POLL_INTERVAL))
+                except CancelledError:
+                    raise PreventUpdate
+                except TimeoutError:
+                    if _latest.get(slot) is not future:
+                        # Newer inputs arrived from this client; drop this result
+                        future.cancel()
+                        raise PreventUpdate
+        finally:
+            with _latest_lock:
+                if _latest.get(slot) is future:
+                    del _latest[slot]
+
+    return wrapper
+
+
+def init_background(server):
+    """Give every browser a client id cookie so its superseded jobs can be found."""
+    if not BACKGROUND_CALLBACKS:
+        return server
+
+    @server.after_request
+    def set_client_cookie(response):
+        if CLIENT_COOKIE not in request.cookies:
+            response.set_cookie(CLIENT_COOKIE, uuid.uuid4().hex, httponly=True, samesite="Lax")
+        return response
+
+    return server
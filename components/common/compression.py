@@ -0,0 +1,74 @@
+"""Response compression for Dash callback and layout responses.
+
+Callback responses carry full Plotly figures, which are large and highly
+repetitive JSON. Responses are compressed with brotli or gzip, negotiated
+through Accept-Encoding. Brotli is used only when the ``brotli`` package is
+installed.
+"""
+
+import gzip
+import logging
+import os
+
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "1024"))
+COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+# Callback, layout and dependency responses are JSON, the index page is HTML
+COMPRESS_MIMETYPES = {"application/json", "text/html"}
+
+
+def available_encodings():
+    """Encodings the server can produce, in order of preference."""
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def compress(data, encoding, level=None, quality=None):
+    """Compress bytes with the given content encoding."""
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY if quality is None else quality)
+    return gzip.compress(data, compresslevel=COMPRESS_LEVEL if level is None else level)
+
+
+def compress_response(response):
+    """Compress an eligible response according to the request's Accept-Encoding."""
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESS_MIMETYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = request.accept_encodings.best_match(available_encodings())
+    if encoding is None:
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.set_data(compress(data, encoding))
+    response.headers["Content-Encoding"] = encoding
+    logger.debug(
+        "Compressed %s with %s: %d -> %d bytes",
+        request.path,
+        encoding,
+        len(data),
+        response.content_length,
+    )
+    return response
+
+
+def init_compression(server):
+    """Register response compression on a Flask server."""
+    server.after_request(compress_response)
@@ -1,5 +1,18 @@
 """Module for selecting gender-specific metrics and columns."""
 
+GENDERS = ("Both", "Male", "Female")
+METRIC_NAMES = (
+    "Prevalence Percent",
+    "Prevalence Rate",
+    "Prevalence",
+    "Death Percent",
+    "Death Rate",
+    "Death",
+)
+# Selections the sidebar starts with
+DEFAULT_GENDER = "Both"
+DEFAULT_METRIC = "Death Rate"
+
 
 def get_metric_column(gender: str, metric: str) -> str:
     """Get the appropriate column name based on gender and metric.
@@ -0,0 +1,55 @@
+"""Incremental figure updates with Dash partial property updates.
+
+A figure callback keeps the signature of the figure it last sent in a small
+``dcc.Store``. When the next figure differs only in its data arrays, title,
+shapes and annotations, such as the same countries in another year, the
+callback sends a ``Patch`` that replaces just those values instead of the
+whole figure.
+"""
+
+import hashlib
+import json
+
+from dash import Patch
+
+# Trace and layout properties a patch may replace; everything else must match
+PATCHABLE_TRACE_KEYS = ("x", "y", "z", "zmin", "zmax")
+PATCHABLE_LAYOUT_KEYS = ("title", "shapes", "annotations")
+
+
+def figure_signature(figure):
+    """Digest of a JSON-ready figure without its patchable properties."""
+    skeleton = {
+        "data": [
+            {key: value for key, value in trace.items() if key not in PATCHABLE_TRACE_KEYS}
+            for trace in figure.get("data", [])
+        ],
+        "layout": {
+            key: value
+            for key, value in figure.get("layout", {}).items()
+            if key not in PATCHABLE_LAYOUT_KEYS
+        },
+    }
+    return hashlib.sha1(json.dumps(skeleton, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def incremental_figure(figure, previous_signature):
+    """Return the update to send for figure and its signature.
+
+    The update is a Patch of the data arrays, title and mark-ups when the figure
+    has the same signature as the one already shown, otherwise the full figure.
+    """
+    signature = figure_signature(figure)
+    if signature != previous_signature:
+        return figure, signature
+
+    patch = Patch()
+    for index, trace in enumerate(figure.get("data", [])):
+        for key in PATCHABLE_TRACE_KEYS:
+            if key in trace:
+                patch["data"][index][key] = trace[key]
+    layout = figure.get("layout", {})
+    for key in PATCHABLE_LAYOUT_KEYS:
+        if key in layout:
+            patch["layout"][key] = layout[key]
+    return patch, signature
@@ -1,7 +1,7 @@
 """Utility module for creating common plot layouts."""
 
 import dash_bootstrap_components as dbc
-from dash import html
+from dash import dcc, html
 
 from components.data.data import data
 from components.visualisations import create_bar_plot, create_line_plot, create_scatter_plot
@@ -52,3 +52,35 @@ def create_plot_grid(df, col, selected_countries, top_n):
             "boxShadow": "0 2px 4px rgba(0,0,0,0.05)",
         },
     )
+
+
+GRAPH_STYLE = {"height": "100%"}
+GRAPH_CONFIG = {"displayModeBar": False}
+
+
+def create_plot_card(graph_id, title, header_id=None):
+    """Create a card holding one graph that its own callback fills in."""
+    header = html.H4(title, className="text-center")
+    if header_id:
+        header.id = header_id
+    return dbc.Col(
+        dbc.Card(
+            [
+                dbc.CardHeader(header),
+                dbc.CardBody(
+                    dcc.Loading(
+                        dcc.Graph(id=graph_id, style=GRAPH_STYLE, config=GRAPH_CONFIG),
+                        type="default",
+                        color="#00AEF0",
+                    ),
+                    style={"height": "350px", "overflow": "auto"},
+                ),
+            ],
+            className="mb-3 shadow-sm",
+        ),
+        xs=12,
+        sm=12,
+        md=6,
+        lg=6,
+        xl=6,
+    )
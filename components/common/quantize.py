@@ -0,0 +1,114 @@
+"""Significant-digit quantization for Store payloads and figure traces.
+
+Charts and ``format_value`` show at most three significant figures, so the
+metric columns and trace arrays are rounded to a configurable number of
+significant digits before they are serialized. Digits are set per column
+class through ``QUANTIZE_DIGITS``, e.g. ``"rate=4,count=3,economic=3,figure=4"``;
+a class set to 0 is left untouched. With ``QUANTIZE_REPORT`` enabled the bytes
+saved are logged for every producer and figure builder.
+"""
+
+import json
+import logging
+import os
+from collections import defaultdict
+
+import numpy as np
+import plotly
+import plotly.io as pio
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIGITS = {"rate": 4, "count": 4, "economic": 4, "figure": 4}
+
+
+def parse_digits(spec):
+    """Parse a ``class=digits,...`` spec on top of DEFAULT_DIGITS."""
+    digits = dict(DEFAULT_DIGITS)
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        digits[name.strip()] = int(value)
+    return digits
+
+
+QUANTIZE_DIGITS = parse_digits(os.getenv("QUANTIZE_DIGITS", ""))
+QUANTIZE_REPORT = os.getenv("QUANTIZE_REPORT", "false").lower() in ("1", "true", "yes")
+# Plotly 6 sends numpy arrays as base64 typed arrays, where float32 halves the size
+TYPED_ARRAYS = int(plotly.__version__.split(".")[0]) >= 6
+
+# Per producer or figure builder: [calls, bytes before, bytes after]
+BYTES_SAVED = defaultdict(lambda: [0, 0, 0])
+
+
+def column_class(col):
+    """Return the quantization class of a column, or None to leave it as is."""
+    if col == "gdp_pc":
+        return "economic"
+    if col == "Population" or (col.startswith("val") and "number" in col):
+        return "count"
+    if col.startswith("val"):
+        return "rate"
+    return None
+
+
+def quantize_frame(df, widen=False):
+    """Round the metric, population and GDP columns to their significant digits.
+
+    Rounded columns keep their dtype, so Float32 columns stay four bytes wide in
+    Arrow payloads. With ``widen`` they are cast to Float64 instead, so JSON
+    encodings write them as short decimals.
+    """
+    exprs = []
+    for col, dtype in df.schema.items():
+        digits = QUANTIZE_DIGITS.get(column_class(col), 0)
+        if digits and dtype.is_float():
+            rounded = pl.col(col).cast(pl.Float64).round_sig_figs(digits)
+            exprs.append(rounded if widen else rounded.cast(dtype))
+    return df.with_columns(exprs) if exprs else df
+
+
+def round_significant(values, digits):
+    """Round a float array to ``digits`` significant digits, keeping 0, NaN and inf."""
+    values = np.asarray(values, dtype=np.float64)
+    finite = np.isfinite(values) & (values != 0)
+    magnitude = np.floor(np.log10(np.abs(values, where=finite, out=np.ones_like(values))))
+    scale = 10.0 ** (digits - 1 - magnitude)
+    return np.where(finite, np.round(values * scale) / scale, values)
+
+
+def quantize_figure(fig, name):
+    """Quantize the numeric x, y and z arrays of every trace and animation frame in place."""
+    digits = QUANTIZE_DIGITS.get("figure", 0)
+    if not digits:
+        return fig
+    before = len(pio.to_json(fig)) if QUANTIZE_REPORT else 0
+    traces = list(fig.data) + [trace for frame in fig.frames for trace in frame.data]
+    for trace in traces:
+        for attr in ("x", "y", "z"):
+            values = getattr(trace, attr, None)
+            if not isinstance(values, np.ndarray) or values.dtype.kind != "f":
+                continue
+            rounded = round_significant(values, digits)
+            if TYPED_ARRAYS and digits <= 6:
+                rounded = rounded.astype(np.float32)
+            trace[attr] = rounded
+    if QUANTIZE_REPORT:
+        record_saving(name, before, len(pio.to_json(fig)))
+    return fig
+
+
+def quantize_payload(df, encode, name, widen=False):
+    """Quantize a frame and encode it as a Store payload, recording the bytes saved."""
+    payload = encode(quantize_frame(df, widen))
+    if QUANTIZE_REPORT:
+        record_saving(name, len(json.dumps(encode(df))), len(json.dumps(payload)))
+    return payload
+
+
+def record_saving(name, before, after):
+    stats = BYTES_SAVED[name]
+    stats[0] += 1
+    stats[1] += before
+    stats[2] += after
+    logger.info("%s: quantization saved %d bytes (%d -> %d)", name, before - after, before, after)
@@ -0,0 +1,102 @@
+"""Pluggable JSON serializer for Dash callback outputs and figures.
+
+Dash serializes every response through ``plotly.io.json.to_json_plotly``.
+Plotly's orjson engine only handles plain data; when the object holds Dash
+components it falls back to a Python-level walk over the whole tree, which
+converts every component before encoding. The ``orjson`` engine here encodes
+the tree in one ``orjson.dumps`` pass instead. Components and figures are
+unpacked through orjson's ``default`` hook, and numpy and Polars arrays are
+written directly with no per-element conversion to Python floats.
+
+Select the engine with ``JSON_ENGINE`` (``orjson`` or ``plotly``). When
+orjson is not installed the Plotly serializer is kept.
+"""
+
+import datetime
+import decimal
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.io.json as plotly_json
+import polars as pl
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JSON_ENGINE = os.getenv("JSON_ENGINE", "orjson")
+
+# Same escaping as Plotly, so the output is safe to embed in <script> tags
+_UNSAFE_CHARS = (
+    ("<", "\\u003c"),
+    (">", "\\u003e"),
+    ("/", "\\u002f"),
+    ("\u2028", "\\u2028"),
+    ("\u2029", "\\u2029"),
+)
+
+_plotly_to_json = plotly_json.to_json_plotly
+
+
+def _default(obj):
+    """Convert objects orjson cannot encode natively."""
+    if hasattr(obj, "to_plotly_json"):
+        return obj.to_plotly_json()
+    if isinstance(obj, np.ndarray):
+        # orjson only takes contiguous arrays of native numeric dtypes
+        if obj.dtype.kind in ("b", "i", "u", "f"):
+            return np.ascontiguousarray(obj)
+        if obj.dtype.kind == "M":
+            return np.datetime_as_string(obj).tolist()
+        return obj.tolist()
+    if isinstance(obj, pl.Series):
+        return obj.to_numpy() if obj.dtype.is_numeric() else obj.to_list()
+    if isinstance(obj, (pd.Series, pd.Index)):
+        return _default(obj.to_numpy())
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, datetime.date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _safe(json_str):
+    for unsafe_char, safe_char in _UNSAFE_CHARS:
+        if unsafe_char in json_str:
+            json_str = json_str.replace(unsafe_char, safe_char)
+    return json_str
+
+
+def to_json_fast(plotly_object, pretty=False, engine=None):
+    """Drop-in replacement for ``plotly.io.json.to_json_plotly`` backed by orjson."""
+    if engine not in (None, "auto", "orjson"):
+        return _plotly_to_json(plotly_object, pretty=pretty, engine=engine)
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if pretty:
+        options |= orjson.OPT_INDENT_2
+    try:
+        encoded = orjson.dumps(plotly_object, default=_default, option=options)
+    except TypeError:
+        logger.debug("orjson could not encode %s, using Plotly", type(plotly_object).__name__)
+        return _plotly_to_json(plotly_object, pretty=pretty, engine=engine)
+    return _safe(encoded.decode("utf8"))
+
+
+def install_serializer(engine=None):
+    """Select the JSON serializer used by Dash; returns the engine in effect."""
+    engine = engine or JSON_ENGINE
+    if engine == "orjson" and orjson is None:
+        logger.warning("orjson is not installed, using the Plotly JSON serializer")
+        engine = "plotly"
+    plotly_json.to_json_plotly = to_json_fast if engine == "orjson" else _plotly_to_json
+    logger.info("JSON serializer: %s", engine)
+    return engine
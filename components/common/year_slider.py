@@ -1,13 +1,24 @@
+import os
+
 import dash_bootstrap_components as dbc
 from dash import Input, Output, State, callback, dcc, html
 
 
-def create_year_slider(min_year=1980, max_year=2021, default=2021):
+# Milliseconds between frames while the play button runs
+ANIMATION_INTERVAL_MS = int(os.getenv("ANIMATION_INTERVAL_MS", "5000"))
+
+
+def year_marks(min_year, max_year):
     """Generate marks for the slider using a dictionary comprehension"""
-    marks = {
+    return {
         str(year): str(year) for year in range(min_year, max_year + 1, 10)  # Increased interval
     }
 
+
+def create_year_slider(min_year=1980, max_year=2021, default=2021):
+    """Create the year slider with its play button"""
+    marks = year_marks(min_year, max_year)
+
     return dbc.Container(
         [
             dbc.Row(
@@ -27,7 +38,7 @@ def create_year_slider(min_year=1980, max_year=2021, default=2021):
                             ),
                             dcc.Interval(
                                 id="animation-interval",
-                                interval=5000,  # 5 second between frames
+                                interval=ANIMATION_INTERVAL_MS,
                                 disabled=True,
                             ),
                         ],
@@ -0,0 +1,95 @@
+"""Thread-safe, single-flight caching for the data callbacks."""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Every SingleFlightCache by name, for cache_stats
+CACHES = {}
+
+
+class SingleFlightCache:
+    """TTL cache where concurrent misses on the same key share one computation.
+
+    The first thread to miss on a key computes the value; threads that miss on
+    the same key while it is in flight wait on its future instead of computing
+    it again. Those coalesced misses are counted as stampedes.
+    """
+
+    def __init__(self, name, maxsize, ttl):
+        self.name = name
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self.hits = 0
+        self.misses = 0
+        self.stampedes = 0
+        self.wait_seconds = 0.0
+        CACHES[name] = self
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, computing it at most once at a time."""
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                pass
+            else:
+                self.hits += 1
+                return value
+
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+                self.misses += 1
+            else:
+                self.stampedes += 1
+
+        if not owner:
+            start = time.perf_counter()
+            try:
+                return future.result()
+            finally:
+                waited = time.perf_counter() - start
+                with self._lock:
+                    self.wait_seconds += waited
+                logger.debug("%s: waited %.3fs on in-flight key %s", self.name, waited, key)
+
+        try:
+            value = compute()
+        except BaseException as exc:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            self._cache[key] = value
+            del self._in_flight[key]
+        future.set_result(value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "stampedes": self.stampedes,
+                "wait_seconds": round(self.wait_seconds, 3),
+            }
+
+
+def cache_stats():
+    """Return hit, miss, stampede and wait counters for every named cache."""
+    return {name: cache.stats() for name, cache in CACHES.items()}
@@ -1,15 +1,21 @@
 #! usr/bin/env python3
+import inspect
 import logging
 import os
-from functools import lru_cache
+import threading
+from functools import lru_cache, wraps
 
-import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.ipc
 from cachetools import TTLCache, cached
 from cachetools.keys import hashkey
-from dash import Input, Output, callback
+from dash import Input, Output
 
+from components.common.active_tab import tab_callback
 from components.common.gender_metric_selector import get_metric_column
+from components.data.cache import SingleFlightCache
+from components.data.store import server_side_store
 
 logger = logging.getLogger(__name__)
 
@@ -28,24 +34,209 @@ def cache_key(*args, **kwargs):
     )
 
 
-@cached(cache=TTLCache(maxsize=128, ttl=300), key=cache_key)
-def load_data():
-    """Load data with caching using Polars."""
-    # logger.debug("Cache info for load_data: %s", load_data.cache_info())
-    data_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "heart_processed.csv"
-    )
-    df = pl.read_csv(data_path)
+# Canonical selection covering every known value: rows with a null value are still excluded
+ALL_SELECTED = "<all>"
+
+
+def normalize_selection(values, universe=()):
+    """Canonical form of a multi-select value.
+
+    Returns None when the selection does not filter anything (nothing selected
+    or "All"), ALL_SELECTED when it lists every value of ``universe``, otherwise
+    a sorted tuple.
+    """
+    if not values:
+        return None
+    if isinstance(values, str):
+        values = [values]
+    values = tuple(sorted(set(values)))
+    if "All" in values:
+        return None
+    if universe and set(universe) <= set(values):
+        return ALL_SELECTED
+    return values
+
+
+def normalize_choice(value):
+    """Canonical form of a single-select value: None when it does not filter."""
+    if value in (None, "", "All"):
+        return None
+    return value
+
+
+def normalize_query(query):
+    """Map semantically identical data queries to one canonical form.
+
+    Selections are normalized, gender and metric are collapsed into the metric
+    column they resolve to, and arguments left unset are dropped.
+    """
+    query = dict(query)
+    if "regions" in query:
+        query["regions"] = normalize_selection(query["regions"], UNIQUE_REGIONS)
+    for name in ("country", "countries"):
+        if name in query:
+            query[name] = normalize_selection(query[name], UNIQUE_ENTITIES)
+    for name in ("income", "age", "cause"):
+        if name in query:
+            query[name] = normalize_choice(query[name])
+    if "year" in query:
+        query["year"] = int(query["year"]) if query["year"] else None
+    if "columns" in query:
+        query["columns"] = tuple(query["columns"]) if query["columns"] else None
+    if "gender" in query and "metric" in query:
+        gender, metric = query.pop("gender"), query.pop("metric")
+        query["metric_column"] = get_metric_column(gender, metric) if gender and metric else None
+    return {name: value for name, value in query.items() if value is not None}
+
+
+def query_key(func):
+    """Build a cache key function that normalizes the arguments of ``func``."""
+    signature = inspect.signature(func)
+
+    def key(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return hashkey(*sorted(normalize_query(bound.arguments).items()))
+
+    return key
+
+
+def cached_query(maxsize, ttl):
+    """Cache a data query under its canonical key, see normalize_query.
+
+    Uses a SingleFlightCache, so the cache is safe under threaded workers and
+    concurrent misses on one key are computed once.
+    """
+
+    def decorator(func):
+        cache = SingleFlightCache(func.__name__, maxsize=maxsize, ttl=ttl)
+        key = query_key(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return cache.get_or_compute(key(*args, **kwargs), lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
+
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
+CSV_PATH = os.path.join(DATA_DIR, "heart_processed.csv")
+TRENDS_PATH = os.path.join(DATA_DIR, "trends.csv")
+# Uncompressed Arrow IPC so the file can be memory-mapped and shared between workers.
+# gunicorn.conf.py points DATA_SNAPSHOT_PATH at a copy in shared memory before forking.
+SNAPSHOT_PATH = os.getenv("DATA_SNAPSHOT_PATH", os.path.join(DATA_DIR, "heart_processed.arrow"))
+
+# Low-cardinality string columns stored as dictionary-encoded Enums
+CATEGORICAL_COLUMNS = ("Entity", "Code", "region", "WB_Income", "cause", "age")
+CVD_CAUSE = "Cardiovascular diseases"
+# Rows are stored sorted on these columns so each combination is a contiguous slice
+PARTITION_COLUMNS = ["Year", "age", "cause"]
+
+
+def encode_categoricals(df):
+    """Cast the categorical columns to Enums with a fixed, sorted dictionary.
+
+    Columns that are already Enums are left untouched, so this is a no-op on
+    frames read back from a snapshot.
+    """
+    casts = []
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns and not isinstance(df.schema[col], pl.Enum):
+            categories = sorted(df[col].cast(pl.Utf8).drop_nulls().unique().to_list())
+            casts.append(pl.col(col).cast(pl.Utf8).cast(pl.Enum(categories)))
+    return df.with_columns(casts) if casts else df
+
+
+def read_csv_data(csv_path=CSV_PATH):
+    """Parse the processed CSV and apply the final dtypes."""
+    df = pl.read_csv(csv_path)
     # Pre-process data once during loading: convert Year to integer
     df = df.with_columns(pl.col("Year").cast(pl.Int32))
 
     # Convert numeric columns to efficient types, skipping WB_Income
     schema = df.schema
     float_cols = [col for col, typ in schema.items() if typ == pl.Float64 and col != "WB_Income"]
-    for col in float_cols:
-        df = df.with_columns(pl.col(col).cast(pl.Float32))
+    df = df.with_columns([pl.col(col).cast(pl.Float32) for col in float_cols])
     # Handle WB_Income column
     df = df.with_columns(pl.col("WB_Income").fill_null("Unknown").cast(pl.Utf8))
+    return encode_categoricals(df).sort(PARTITION_COLUMNS, maintain_order=True)
+
+
+def build_snapshot(csv_path=CSV_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Build the columnar Arrow IPC snapshot from the processed CSV.
+
+    The file is written next to its final location and then renamed, so workers
+    starting concurrently never map a partially written snapshot.
+    """
+    df = read_csv_data(csv_path)
+    tmp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    df.write_ipc(tmp_path, compression="uncompressed")
+    os.replace(tmp_path, snapshot_path)
+    logger.info("Built data snapshot %s from %s", snapshot_path, csv_path)
+    return snapshot_path
+
+
+def snapshot_is_stale(csv_path=CSV_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Return True when the snapshot is missing or older than the CSV."""
+    if not os.path.exists(snapshot_path):
+        return True
+    if not os.path.exists(csv_path):
+        return False
+    return os.path.getmtime(snapshot_path) < os.path.getmtime(csv_path)
+
+
+def read_snapshot(snapshot_path=SNAPSHOT_PATH):
+    """Memory-map the Arrow snapshot and wrap it as a Polars frame without copying."""
+    with pa.memory_map(snapshot_path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return encode_categoricals(pl.from_arrow(table, rechunk=False))
+
+
+def partition_bounds(df):
+    """Return the offset, length and span of every (Year, age, cause) group."""
+    return (
+        df.select(PARTITION_COLUMNS)
+        .with_row_index("row")
+        .group_by(PARTITION_COLUMNS)
+        .agg(
+            pl.col("row").min().alias("offset"),
+            pl.len().alias("length"),
+            (pl.col("row").max() - pl.col("row").min() + 1).alias("span"),
+        )
+    )
+
+
+def partitions_are_contiguous(df):
+    """Check that every (Year, age, cause) group occupies a single run of rows."""
+    bounds = partition_bounds(df)
+    return bounds.is_empty() or (bounds["span"] == bounds["length"]).all()
+
+
+def build_partition_index(df):
+    """Map each (Year, age, cause) tuple to a zero-copy slice of the sorted frame."""
+    return {
+        (year, age, cause): df.slice(offset, length)
+        for year, age, cause, offset, length, _ in partition_bounds(df).iter_rows()
+    }
+
+
+@cached(cache=TTLCache(maxsize=128, ttl=300), key=cache_key)
+def load_data():
+    """Load data with caching using Polars.
+
+    Reads the memory-mapped Arrow snapshot, building it from the CSV first when
+    it is missing or out of date.
+    """
+    # logger.debug("Cache info for load_data: %s", load_data.cache_info())
+    if snapshot_is_stale():
+        build_snapshot()
+    df = read_snapshot()
+    if not partitions_are_contiguous(df):
+        # Snapshots written before the partition sort was introduced
+        df = df.sort(PARTITION_COLUMNS, maintain_order=True)
 
     logger.info("Loaded data shape: %s", df.shape)
     return df
@@ -54,48 +245,260 @@ def load_data():
 # Load data once at module level
 data = load_data()
 
-# Pre-calculate unique values for filters
-UNIQUE_REGIONS = sorted(data["region"].drop_nulls().unique())
-UNIQUE_INCOMES = sorted(data["WB_Income"].drop_nulls().unique())
-UNIQUE_ENTITIES = sorted(data["Entity"].unique())
-UNIQUE_AGES = sorted(data["age"].unique())
+# Pre-calculate unique values for filters from the Enum dictionaries
+UNIQUE_REGIONS = data.schema["region"].categories.to_list()
+UNIQUE_INCOMES = data.schema["WB_Income"].categories.to_list()
+UNIQUE_ENTITIES = data.schema["Entity"].categories.to_list()
+UNIQUE_AGES = data.schema["age"].categories.to_list()
 YEAR_RANGE = (int(data["Year"].min()), int(data["Year"].max()))
-METRICS = sorted(data["cause"].unique())
+METRICS = data.schema["cause"].categories.to_list()
+
+# Label -> integer code lookups for the categorical columns
+CATEGORY_CODES = {
+    col: {label: code for code, label in enumerate(data.schema[col].categories.to_list())}
+    for col in CATEGORICAL_COLUMNS
+}
+
+
+def category_code(column, value):
+    """Return the integer code of a category label, or None if it is unknown."""
+    return CATEGORY_CODES[column].get(value)
+
+
+def code_eq(column, value):
+    """Expression matching rows whose categorical column equals a label, by code."""
+    code = category_code(column, value)
+    if code is None:
+        return pl.lit(False)
+    return pl.col(column).to_physical() == code
+
+
+def code_in(column, values):
+    """Expression matching rows whose categorical column is one of the labels, by code."""
+    codes = [code for code in (category_code(column, v) for v in values) if code is not None]
+    return pl.col(column).to_physical().is_in(codes)
+
+
+# Pre-sliced (Year, age, cause) partitions for filter_data
+PARTITIONS = build_partition_index(data)
+
+
+def get_partition(year, age, cause):
+    """Return the rows for one (Year, age, cause) combination without scanning."""
+    return PARTITIONS.get((int(year), age, cause), data.clear())
+
+
+# Row positions of each entity in (Entity, cause, age, Year) order, so a country's
+# rows are gathered from the mapped frame instead of kept in a sorted copy
+ENTITY_COLUMNS = ["Entity", "cause", "age", "Year"]
+
+
+def build_entity_index(df):
+    """Map each entity to the positions of its rows, sorted by cause, age and Year."""
+    positions = df.select(ENTITY_COLUMNS).with_row_index("row").sort(ENTITY_COLUMNS)
+    bounds = (
+        positions.select("Entity")
+        .with_row_index("offset")
+        .group_by("Entity")
+        .agg(pl.col("offset").min(), pl.len().alias("length"))
+    )
+    rows = positions["row"]
+    return {entity: rows.slice(offset, length) for entity, offset, length in bounds.iter_rows()}
+
+
+def get_entity_rows(entity):
+    """Return every row of one entity without scanning the full frame."""
+    columns = ENTITY_COLUMNS + METRIC_COLUMNS
+    rows = ENTITY_INDEX.get(entity)
+    if rows is None:
+        return data.select(columns).clear()
+    return data.select(columns)[rows]
+
+
+# World-map rows: the cardiovascular rows with the id and metric columns only
+METRIC_COLUMNS = [col for col in data.columns if col.startswith("val")]
+WORLD_MAP_COLUMNS = ["Year", "age", "Entity", "Code", "region", "WB_Income", "cause"]
+
+
+def world_map_rows(year=None, age=None):
+    """Return the world-map columns of the cardiovascular rows, sorted by Entity.
+
+    With both year and age this projects one pre-sliced partition of the mapped
+    frame, so no worker holds a private copy of the map data.
+    """
+    if year and age:
+        rows = get_partition(year, age, CVD_CAUSE).lazy()
+    else:
+        rows = data.lazy().filter(code_eq("cause", CVD_CAUSE))
+        if year:
+            rows = rows.filter(pl.col("Year") == year)
+        if age:
+            rows = rows.filter(code_eq("age", age))
+    return rows.select(WORLD_MAP_COLUMNS + METRIC_COLUMNS).sort(["Year", "age", "Entity"])
+
+
+ENTITY_INDEX = build_entity_index(data)
+
+
+def selection_predicate(column, selection):
+    """Expression for a normalized multi-select value, see normalize_selection."""
+    if selection == ALL_SELECTED:
+        # Same rows as is_in(every value), without comparing codes
+        return pl.col(column).is_not_null()
+    return code_in(column, selection)
+
+
+def selection_predicates(regions=None, income=None, countries=None):
+    """Code-based predicates for the sidebar region, income and country selections."""
+    regions = normalize_selection(regions, UNIQUE_REGIONS)
+    countries = normalize_selection(countries, UNIQUE_ENTITIES)
+    income = normalize_choice(income)
+
+    predicates = []
+    if regions:
+        predicates.append(selection_predicate("region", regions))
+    if income:
+        predicates.append(code_eq("WB_Income", str(income)))
+    if countries:
+        predicates.append(selection_predicate("Entity", countries))
+    return predicates
+
 
 # Pre-calculate region to countries mapping
 REGION_COUNTRIES = {
-    region: sorted(data.filter(pl.col("region") == region)["Entity"].unique())
+    region: sorted(data.filter(code_eq("region", region))["Entity"].unique().to_list())
     for region in UNIQUE_REGIONS
 }
 
 
-@cached(cache=TTLCache(maxsize=32, ttl=300), key=cache_key)
+class QueryPlanner:
+    """Shared base slices for the data callbacks that listen to the same inputs.
+
+    One sidebar change fires several Store callbacks whose queries differ only in
+    the metric they require and the columns they keep. The planner scans the
+    rows of a selection once and caches only their positions in the mapped
+    frame; each callback then gathers just the columns of its Store. Scans
+    saved are counted per base slice and in total.
+    """
+
+    def __init__(self, maxsize=32, ttl=300):
+        self._slices = SingleFlightCache("base_slice", maxsize=maxsize, ttl=ttl)
+        self._key = query_key(self.scan)
+        self._lock = threading.Lock()
+        self._projections = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.scans = 0
+        self.projections = 0
+
+    @staticmethod
+    def scan(year=None, regions=None, income=None, age=None, cause=None, countries=None):
+        """Return the frame a selection starts from and the positions of its rows.
+
+        The positions are None when every row of that frame matches.
+        """
+        predicates = selection_predicates(regions, income, countries)
+        if year and age and cause:
+            # Start from the pre-sliced partition instead of scanning the whole frame
+            base = get_partition(year, age, cause)
+        else:
+            base = data
+            if year:
+                predicates.append(pl.col("Year") == year)
+            if age:
+                predicates.append(code_eq("age", age))
+            if cause:
+                predicates.append(code_eq("cause", cause))
+
+        if not predicates:
+            return base, None
+        # Only the predicate columns are read; no column of the rows is copied
+        rows = base.select(pl.arg_where(pl.all_horizontal(predicates)).alias("row"))["row"]
+        return base, rows
+
+    def base_slice(self, **selection):
+        """Return the base slice of a selection, scanning only on the first request."""
+        key = self._key(**selection)
+
+        def compute():
+            with self._lock:
+                self.scans += 1
+            return self.scan(**selection)
+
+        return key, self._slices.get_or_compute(key, compute)
+
+    def project(self, metric_col=None, columns=None, **selection):
+        """Derive one Store's rows and columns from the shared base slice."""
+        key, (base, rows) = self.base_slice(**selection)
+        frame = base
+        if columns:
+            # Gather only the columns this Store keeps, plus the metric it filters on
+            needed = list(dict.fromkeys(list(columns) + ([metric_col] if metric_col else [])))
+            frame = frame.select(needed)
+        if rows is not None:
+            frame = frame[rows]
+        query = frame.lazy()
+        if metric_col:
+            query = query.filter(pl.col(metric_col).is_not_null())
+        if columns:
+            query = query.select(columns)
+
+        with self._lock:
+            self.projections += 1
+            served = self._projections.get(key, 0) + 1
+            self._projections[key] = served
+        logger.debug(
+            "Query plan %s: %d projections from one scan, %d scans saved",
+            dict(key),
+            served,
+            served - 1,
+        )
+        return query.collect()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "scans": self.scans,
+                "projections": self.projections,
+                "scans_saved": self.projections - self.scans,
+            }
+
+
+PLANNER = QueryPlanner()
+
+
+@cached_query(maxsize=32, ttl=300)
 def filter_data(
-    year=None, regions=None, income=None, gender="Both", metric=None, age=None, cause=None
+    year=None,
+    regions=None,
+    income=None,
+    gender="Both",
+    metric=None,
+    age=None,
+    cause=None,
+    countries=None,
+    columns=None,
 ):
-    """Base filter function for filtering data based on various criteria."""
-    filtered = data
-    if year:
-        filtered = data.filter(pl.col("Year") == year)
-    if regions and regions != ["All"]:
-        filtered = filtered.filter(pl.col("region").is_in(regions))
-    if income and income != "All":
-        filtered = filtered.filter(pl.col("WB_Income") == str(income))
-    if age:
-        filtered = filtered.filter(pl.col("age") == age)
-    if cause:
-        filtered = filtered.filter(pl.col("cause") == cause)
-
-    if metric and gender:
-        col = get_metric_column(gender, metric)
-        if col:
-            filtered = filtered.drop_nulls(subset=[col])
+    """Base filter function for filtering data based on various criteria.
+
+    The rows come from the planner's shared base slice for the selection; only
+    the metric filter and, when ``columns`` is given, the projection run here.
+    """
+    metric_col = get_metric_column(gender, metric) if metric and gender else None
+    filtered = PLANNER.project(
+        metric_col,
+        columns,
+        year=year,
+        regions=regions,
+        income=income,
+        age=age,
+        cause=cause,
+        countries=countries,
+    )
     logger.debug(msg=f"columns: {filtered.columns}")
     return filtered
 
 
 data_2019 = (
-    filter_data(year=2019, age="Age-standardized", cause="Cardiovascular diseases")
+    filter_data(year=2019, age="Age-standardized", cause=CVD_CAUSE)
     .with_columns(pl.col("t_htn_ctrl").cast(pl.Float64, strict=False))
     .with_columns(pl.col("t_high_bp_30-79").cast(pl.Float64, strict=False))
     .with_columns(pl.col("t_htn_diag").cast(pl.Float64, strict=False))
@@ -104,7 +507,8 @@ data_2019 = (
 print(data_2019.head())
 
 
-@callback(
+@tab_callback(
+    "geo-eco",
     Output("geo-eco-data", "data"),
     Input("year-slider", "value"),
     Input("region-dropdown", "value"),
@@ -114,43 +518,50 @@ print(data_2019.head())
     Input("age-dropdown", "value"),
     Input("country-dropdown", "value"),
 )
-@cached(cache=TTLCache(maxsize=32, ttl=300), key=cache_key)
+@server_side_store("geo-eco-data")
+@cached_query(maxsize=32, ttl=300)
 def get_geo_eco_data(year, regions, income, gender, metric, age, country):
     """Get filtered data for geo-economic visualizations."""
 
     if not year or not gender or not metric:
-        return []
+        return None
 
     cols = [get_metric_column(g, metric) for g in ["Both", "Female", "Male"]]
     cols = [col for col in cols if col]
 
+    keep_cols = [
+        "Entity",
+        "Year",
+        "Code",
+        "gdp_pc",
+        "WB_Income",
+        "Population",
+        "region",
+        "cause",
+    ] + cols
     df = filter_data(
-        year, regions, income, gender, metric, age=age, cause="Cardiovascular diseases"
+        year,
+        regions,
+        income,
+        gender,
+        metric,
+        age=age,
+        cause=CVD_CAUSE,
+        countries=country,
+        columns=keep_cols if cols else None,
     )
-    if country:
-        df = df.filter(pl.col("Entity").is_in(country))
 
     if cols:
-        keep_cols = [
-            "Entity",
-            "Year",
-            "Code",
-            "gdp_pc",
-            "WB_Income",
-            "Population",
-            "region",
-            "cause",
-        ] + cols
-        df = df.select(keep_cols)
         df = df.with_columns(
             [pl.col(col).cast(pl.Float32) for col in cols + ["gdp_pc", "Population"]]
         )
         df = df.drop_nulls(subset=cols + ["gdp_pc", "Population"])
 
-    return df.to_dicts()
+    return df
 
 
-@callback(
+@tab_callback(
+    "world-map",
     Output("world-map-data", "data"),
     Input("year-slider", "value"),
     Input("region-dropdown", "value"),
@@ -159,45 +570,82 @@ def get_geo_eco_data(year, regions, income, gender, metric, age, country):
     Input("metric-dropdown", "value"),
     Input("age-dropdown", "value"),
 )
+@server_side_store("world-map-data")
+@cached_query(maxsize=32, ttl=300)
 def get_world_map_data(year, regions, income, gender, metric, age):
     """Get filtered data for world map visualization."""
     if not year or not metric or not gender:
-        return []
+        return None
 
-    df = filter_data(year, regions, income, gender, metric, age)
     col = get_metric_column(gender, metric)
-    df = df.with_columns(pl.col(col).cast(pl.Float64, strict=False))
+    if not col:
+        return None
+
+    predicates = selection_predicates(regions, income) + [pl.col(col).is_not_null()]
+    return (
+        world_map_rows(int(year), age)
+        .filter(predicates)
+        .select(
+            "Entity",
+            "Code",
+            pl.col(col).cast(pl.Float64, strict=False),
+            "region",
+            "WB_Income",
+            "cause",
+        )
+        .collect()
+    )
 
-    if col:
-        df = df.select(["Entity", "Code", col, "region", "WB_Income", "cause"])
-        df = df.filter(pl.col("cause").str.to_lowercase() == "cardiovascular diseases")
 
-    return df.to_dicts()
+@cached_query(maxsize=16, ttl=300)
+def get_world_map_frames(regions, income, gender, metric, age):
+    """Get the world-map values of every year for the in-browser map animation."""
+    col = get_metric_column(gender, metric)
+    if not col or not age:
+        return None
+
+    predicates = selection_predicates(regions, income) + [pl.col(col).is_not_null()]
+    return (
+        world_map_rows(age=age)
+        .filter(predicates)
+        .select("Year", "Entity", pl.col(col).cast(pl.Float64, strict=False))
+        .collect()
+    )
 
 
-@callback(
+def load_trends(trends_path=TRENDS_PATH):
+    """Load trends.csv once and split it into one frame per metric column.
+
+    The per-metric frames share the column buffers of the loaded table, so the
+    split costs no copies.
+    """
+    df = pl.read_csv(trends_path).with_columns(pl.col("Year").cast(pl.Int32))
+    metric_cols = [col for col in df.columns if col.startswith("val")]
+    return {col: df.select(["cause", "age", "Year", col]) for col in metric_cols}
+
+
+# Trends keyed by metric column, loaded once at module level
+TRENDS = load_trends()
+
+
+@tab_callback(
+    "trends",
     Output("trends-data", "data"),
     Input("metric-dropdown", "value"),
     Input("gender-dropdown", "value"),
 )
+@server_side_store("trends-data")
 def get_trends_data(metric, gender):
     """Get filtered data for trends visualization."""
+    col = get_metric_column(gender, metric)
+    if col not in TRENDS:
+        return None
 
-    data_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "trends.csv"
-    )
-    df = pl.read_csv(data_path)
-
-    metric = get_metric_column(gender, metric)
-
-    df = df.select(["cause", "age", "Year", metric])
-    # Pre-process data once during loading: convert Year to integer
-    df = df.with_columns(pl.col("Year").cast(pl.Int32))
-
-    return df.to_dicts()
+    return TRENDS[col]
 
 
-@callback(
+@tab_callback(
+    "healthcare",
     Output("healthcare-data", "data"),
     Input("year-slider", "value"),
     Input("region-dropdown", "value"),
@@ -207,10 +655,22 @@ def get_trends_data(metric, gender):
     Input("age-dropdown", "value"),
     Input("country-dropdown", "value"),
 )
+@server_side_store("healthcare-data")
+@cached_query(maxsize=32, ttl=300)
 def get_healthcare_data(year, regions, income, gender, metric, age, country):
     """Get filtered data for healthcare system visualization."""
     if not year or not metric:
-        return []
+        return None
+
+    # Keep required columns
+    required_cols = ["Entity", "Code", "region", "WB_Income", "Year", "cause"]
+    optional_cols = ["obesity%"]
+
+    # Add all val* columns
+    val_cols = METRIC_COLUMNS
+
+    # Check which optional columns exist and combine with val columns
+    available_cols = required_cols + val_cols + [c for c in optional_cols if c in data.columns]
 
     df = filter_data(
         year,
@@ -219,77 +679,58 @@ def get_healthcare_data(year, regions, income, gender, metric, age, country):
         gender=gender,
         metric=metric,
         age=age,
-        cause="Cardiovascular diseases",
+        cause=CVD_CAUSE,
+        countries=country,
+        columns=available_cols,
     )
-    if country:
-        df = df.filter(pl.col("Entity").is_in(country))
-
-    # Keep required columns
-    required_cols = ["Entity", "Code", "region", "WB_Income", "Year", "cause"]
-    optional_cols = ["obesity%"]
-
-    # Add all val* columns
-    val_cols = [col for col in df.columns if col.startswith("val")]
-
-    # Check which optional columns exist and combine with val columns
-    available_cols = required_cols + val_cols + [c for c in optional_cols if c in df.columns]
 
     # Only keep rows where required columns are not null
-
-    df = df.select(available_cols).drop_nulls(subset=required_cols)
+    df = df.drop_nulls(subset=required_cols)
 
     logger.debug(f"Healthcare data shape: {df.shape}")
     logger.debug(df.head())
-    return df.to_dicts()
+    return df
 
 
-@callback(
+@tab_callback(
+    "geo-eco",
     Output("sankey-data", "data"),
     Input("region-dropdown", "value"),
     Input("income-dropdown", "value"),
     Input("gender-dropdown", "value"),
     Input("metric-dropdown", "value"),
 )
+@server_side_store("sankey-data")
+@cached_query(maxsize=32, ttl=300)
 def get_sankey_data(regions, income, gender, metric):
     """Get unfiltered data for Sankey diagram visualization."""
-    df = filter_data(
-        year=2019,
-        regions=regions,
-        income=income,
-        gender=gender,
-        metric=metric,
-        cause="Cardiovascular diseases",
-        age="Age-standardized",
-    )
     col = get_metric_column(gender, metric)
 
-    if col and col in df.columns:
+    if col and col in data.columns:
         required_cols = ["Entity", "Code", "region", "WB_Income", "Year", "cause"]
-        df = df.select(required_cols + [col]).drop_nulls(subset=required_cols + [col])
+        df = filter_data(
+            year=2019,
+            regions=regions,
+            income=income,
+            gender=gender,
+            metric=metric,
+            cause=CVD_CAUSE,
+            age="Age-standardized",
+            columns=required_cols + [col],
+        )
+        df = df.drop_nulls(subset=required_cols + [col])
         logger.debug(f"Sankey data shape: {df.shape}")
         logger.debug(msg=df.head())
-        return df.to_dicts()
+        return df
 
-    return []
+    return None
 
 
-@callback(
-    Output("risk-data", "data"),
-    Input("gender-dropdown", "value"),
-    Input("metric-dropdown", "value"),
-)
 def get_risk_data(gender, metric):
-    """Get unfiltered data for Sankey diagram visualization."""
-    df = filter_data(
-        year=2019,
-        gender=gender,
-        metric=metric,
-        cause="Cardiovascular diseases",
-        age="Age-standardized",
-    )
+    """Get the 2019 risk factors and metric as numeric columns for a correlation matrix."""
     col = get_metric_column(gender, metric)
 
-    if col and col in df.columns:
+    if col and col in data.columns:
         required_cols = [
             "obesity%",
             "t_htn_ctrl",
@@ -297,7 +738,15 @@ def get_risk_data(gender, metric):
             "pacemaker_1m",
             "t_htn_diag",  # ,'t_htn_rx_30-79'
         ]
-        df = df.select(required_cols + [col]).drop_nulls(subset=required_cols + [col])
+        df = filter_data(
+            year=2019,
+            gender=gender,
+            metric=metric,
+            cause=CVD_CAUSE,
+            age="Age-standardized",
+            columns=required_cols + [col],
+        )
+        df = df.drop_nulls(subset=required_cols + [col])
         for col in required_cols:
             df = df.with_columns(pl.col(col).cast(pl.Float64, strict=False))
 
@@ -308,6 +757,6 @@ def get_risk_data(gender, metric):
         ]
         df_numeric = df.select(numeric_cols)
         # matrix = df_numeric.corr()
-        return df_numeric.to_dicts()
+        return df_numeric
 
-    return []
+    return None
@@ -0,0 +1,116 @@
+"""Figure-level cache shared by the plot callbacks.
+
+Finished figures and plot grids are stored as JSON-ready dicts, keyed on the
+callback name and the canonical query behind its inputs, so the same view
+requested again costs one lookup. Entries are evicted least recently used
+first once the serialized size of the cache exceeds its byte budget.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+import plotly.io.json as plotly_json
+
+from components.data.data import make_hashable, query_key
+from components.data.store import STORES, is_store_handle
+
+logger = logging.getLogger(__name__)
+
+FIGURE_CACHE_BYTES = int(os.getenv("FIGURE_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+
+class FigureCache:
+    """Thread-safe LRU cache of JSON-ready values with a byte budget."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+FIGURE_CACHE = FigureCache(FIGURE_CACHE_BYTES)
+
+_handle_keys = {}
+
+
+def payload_key(value):
+    """Hashable key for a callback input.
+
+    Store handles map to the canonical key of the query they carry, other Store
+    payloads to a digest of their content.
+    """
+    if is_store_handle(value):
+        store_id = value["store"]
+        if store_id not in _handle_keys:
+            _handle_keys[store_id] = query_key(STORES[store_id])
+        return (store_id, _handle_keys[store_id](*value["args"]))
+    if isinstance(value, dict) or (isinstance(value, list) and any(isinstance(v, dict) for v in value)):
+        encoded = json.dumps(value, sort_keys=True, default=str).encode()
+        return hashlib.sha1(encoded).hexdigest()
+    return make_hashable(value)
+
+
+def cached_figure(name, cache=FIGURE_CACHE):
+    """Cache a plot callback's output as a JSON-ready dict under its canonical inputs."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            key = (name,) + tuple(payload_key(arg) for arg in args)
+            value = cache.get(key)
+            if value is None:
+                encoded = plotly_json.to_json_plotly(func(*args))
+                value = json.loads(encoded)
+                cache.put(key, value, len(encoded))
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,126 @@
+"""Background prefetch of the years a slider is about to show.
+
+While the year slider plays or is dragged, one callback schedules the
+payloads and figures of the next few years on a small thread pool, using the
+warm-up function the active tab registered with ``prefetch_warmer``. They
+land in the query and figure caches, so the following ticks are served warm.
+
+Those caches live in the memory of one process. Under gunicorn only the worker
+that received the slider event is warmed, and a tick served by another worker
+is computed cold. Run a single worker with several threads (WEB_CONCURRENCY=1,
+GUNICORN_THREADS>1) to have every tick benefit from the prefetch.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from dash import Input, State, callback
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_YEARS = int(os.getenv("PREFETCH_YEARS", "3"))
+PREFETCH_WORKERS = int(os.getenv("PREFETCH_WORKERS", "2"))
+
+# Warm-up function of each tab, keyed by the tab name kept in tab-store
+WARMERS = {}
+
+
+def upcoming_years(year, min_year, max_year, count=PREFETCH_YEARS):
+    """Return the next count years after year, wrapping like the play button does."""
+    if year is None or min_year is None or max_year is None:
+        return []
+    span = max_year - min_year + 1
+    steps = range(1, min(count, span - 1) + 1)
+    return [min_year + (year - min_year + step) % span for step in steps]
+
+
+class Prefetcher:
+    """Run warm-up jobs on a thread pool, at most once per key at a time."""
+
+    def __init__(self, workers):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        self._pending = set()
+        self.scheduled = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def schedule(self, key, func, *args):
+        """Queue func(*args) unless a job with the same key is already pending."""
+        with self._lock:
+            if key in self._pending:
+                self.skipped += 1
+                return False
+            self._pending.add(key)
+            self.scheduled += 1
+        self._executor.submit(self._run, key, func, args)
+        return True
+
+    def _run(self, key, func, args):
+        try:
+            func(*args)
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            logger.exception("Prefetch of %s failed", key)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "scheduled": self.scheduled,
+                "skipped": self.skipped,
+                "failed": self.failed,
+            }
+
+
+PREFETCHER = Prefetcher(PREFETCH_WORKERS)
+
+
+def prefetch_years(name, warm, year, min_year, max_year, *args):
+    """Schedule warm(next_year, *args) for each upcoming year of a slider."""
+    if not PREFETCH_YEARS:
+        return
+    for next_year in upcoming_years(year, min_year, max_year):
+        PREFETCHER.schedule((name, next_year) + tuple(map(repr, args)), warm, next_year, *args)
+
+
+def prefetch_warmer(tab):
+    """Register warm(year, regions, income, gender, metric, age, country, top_n) for a tab."""
+
+    def decorator(warm):
+        WARMERS[tab] = warm
+        return warm
+
+    return decorator
+
+
+@callback(
+    Input("year-slider", "value"),
+    State("year-slider", "min"),
+    State("year-slider", "max"),
+    State("region-dropdown", "value"),
+    State("income-dropdown", "value"),
+    State("gender-dropdown", "value"),
+    State("metric-dropdown", "value"),
+    State("age-dropdown", "value"),
+    State("country-dropdown", "value"),
+    State("top-filter-slider", "value"),
+    State("tab-store", "data"),
+)
+def prefetch_active_tab(year, min_year, max_year, *args):
+    """Warm the next years' views of the active tab while the slider plays or moves.
+
+    The year slider is shared, so this is the only prefetch callback: Dash keys
+    callbacks without outputs by their inputs, and a second one with the same
+    inputs would replace it.
+    """
+    *selection, tab_store = args
+    tab = (tab_store or {}).get("active")
+    if tab in WARMERS:
+        prefetch_years(tab, WARMERS[tab], year, min_year, max_year, *selection)
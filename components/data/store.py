@@ -0,0 +1,100 @@
+"""Server-side data stores.
+
+In server-side mode the data callbacks keep their frames in the server cache
+and put only a small handle in the ``dcc.Store``:
+``{"store": <store id>, "args": [<callback inputs>]}``. Plot callbacks resolve
+the handle back to the frame with ``load_store``. The handle carries the query
+itself, so any worker can resolve it, recomputing the frame on a cache miss.
+
+When frames do travel through the Store they are encoded column-wise rather
+than as a list of row dicts, see ``encode_frame``.
+"""
+
+import base64
+import io
+import os
+from functools import wraps
+
+import polars as pl
+
+from components.common.quantize import quantize_payload
+
+SERVER_SIDE_STORES = os.getenv("SERVER_SIDE_STORES", "true").lower() in ("1", "true", "yes")
+# Payload format for frames sent through the Store: "arrow", "columns" or "rows"
+STORE_ENCODING = os.getenv("STORE_ENCODING", "arrow")
+# Arrow IPC compression: "zstd", "lz4" or "uncompressed"
+STORE_COMPRESSION = os.getenv("STORE_COMPRESSION", "zstd")
+
+# Frame functions by store id, used to resolve handles
+STORES = {}
+
+
+def server_side_store(store_id):
+    """Register a frame function as the producer of a ``dcc.Store``.
+
+    The decorated function returns a Polars frame, or None when its inputs are
+    incomplete. The wrapper returns the Store payload: a handle in server-side
+    mode, the encoded frame otherwise, and an empty list when there is no data.
+    """
+
+    def decorator(frame_func):
+        STORES[store_id] = frame_func
+
+        @wraps(frame_func)
+        def producer(*args):
+            df = frame_func(*args)
+            if df is None or df.is_empty():
+                return []
+            if SERVER_SIDE_STORES:
+                return {"store": store_id, "args": list(args)}
+            # Only the JSON encodings gain from widening the rounded floats
+            return quantize_payload(df, encode_frame, store_id, widen=STORE_ENCODING != "arrow")
+
+        return producer
+
+    return decorator
+
+
+def encode_frame(df, encoding=None, compression=None):
+    """Encode a frame as a Store payload.
+
+    ``arrow`` is base64 Arrow IPC with optional compression, ``columns`` is a
+    dict of column arrays and ``rows`` is the legacy list of row dicts.
+    """
+    encoding = encoding or STORE_ENCODING
+    if encoding == "arrow":
+        compression = compression or STORE_COMPRESSION
+        buffer = df.write_ipc(None, compression=compression)
+        return {
+            "format": "arrow",
+            "compression": compression,
+            "data": base64.b64encode(buffer.getvalue()).decode("ascii"),
+        }
+    if encoding == "columns":
+        return {"format": "columns", "columns": df.to_dict(as_series=False)}
+    return df.to_dicts()
+
+
+def decode_frame(payload):
+    """Decode a payload produced by encode_frame back into a Polars frame."""
+    if isinstance(payload, list):
+        return pl.DataFrame(payload)
+    if payload["format"] == "arrow":
+        return pl.read_ipc(io.BytesIO(base64.b64decode(payload["data"])))
+    if payload["format"] == "columns":
+        return pl.DataFrame(payload["columns"])
+    raise ValueError(f"Unknown Store payload format: {payload['format']}")
+
+
+def is_store_handle(payload):
+    return isinstance(payload, dict) and "store" in payload
+
+
+def load_store(payload):
+    """Resolve a Store payload, handle or encoded frame, to a Polars frame."""
+    if not payload:
+        return pl.DataFrame()
+    if is_store_handle(payload):
+        df = STORES[payload["store"]](*payload["args"])
+        return df if df is not None else pl.DataFrame()
+    return decode_frame(payload)
@@ -1,7 +1,12 @@
 import dash_bootstrap_components as dbc
-import pandas as pd
 from dash import Input, Output, State, callback, dcc, html
 
+from components.common.gender_metric_selector import (
+    DEFAULT_GENDER,
+    DEFAULT_METRIC,
+    GENDERS,
+    METRIC_NAMES,
+)
 from components.data.data import REGION_COUNTRIES, UNIQUE_REGIONS
 
 
@@ -13,11 +18,7 @@ def create_sidebar():
         (
             "GENDER",
             "gender-dropdown",
-            [
-                {"label": "Both", "value": "Both"},
-                {"label": "Male", "value": "Male"},
-                {"label": "Female", "value": "Female"},
-            ],
+            [{"label": gender, "value": gender} for gender in GENDERS],
         ),
         (
             "WORLD INCOME",
@@ -32,14 +33,7 @@ def create_sidebar():
         (
             "METRIC",
             "metric-dropdown",
-            [
-                {"label": "Prevalence Percent", "value": "Prevalence Percent"},
-                {"label": "Prevalence Rate", "value": "Prevalence Rate"},
-                {"label": "Prevalence", "value": "Prevalence"},
-                {"label": "Death Percent", "value": "Death Percent"},
-                {"label": "Death Rate", "value": "Death Rate"},
-                {"label": "Death", "value": "Death"},
-            ],
+            [{"label": metric, "value": metric} for metric in METRIC_NAMES],
         ),
         (
             "AGE",
@@ -61,10 +55,10 @@ def create_sidebar():
                     id=id,
                     options=options,
                     value=(
-                        "Death Rate"
+                        DEFAULT_METRIC
                         if id == "metric-dropdown"
                         else (
-                            "Both"
+                            DEFAULT_GENDER
                             if id == "gender-dropdown"
                             else "Age-standardized" if id == "age-dropdown" else None
                         )
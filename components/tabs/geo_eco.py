@@ -1,19 +1,24 @@
 import logging
 
 import dash_bootstrap_components as dbc
-import pandas as pd
-import polars as pl
-from dash import Input, Output, callback, dcc, html
+from dash import Input, Output, State, dcc
 
 logger = logging.getLogger(__name__)
 
-from components.common.filter_slider import create_filter_slider
+from components.common.active_tab import tab_callback
+from components.common.background import offloaded
 from components.common.gender_metric_selector import get_metric_column
-from components.common.year_slider import create_year_slider
+from components.common.plots import create_plot_card
+from components.common.patches import incremental_figure
+from components.data.data import get_geo_eco_data
+from components.data.figure_cache import cached_figure
+from components.data.prefetch import prefetch_warmer
+from components.data.store import load_store
 from components.visualisations import (
     create_bar_plot,
     create_histogram_plot,
     create_line_plot,
+    create_no_data_figure,
     create_sankey_diagram,
     create_scatter_plot,
 )
@@ -21,172 +26,174 @@ from components.visualisations import (
 
 def create_geo_eco_tab():
     """Function to create layout and visualations in the geo eco tab"""
-    return dcc.Loading(
-        dbc.Container(
-            [
-                # Add Store component for data
-                dcc.Store(id="geo-eco-data"),
-                dcc.Store(id="sankey-data"),
-                dbc.Row(
-                    [
-                        dbc.Col(
-                            create_filter_slider(),
-                            width=12,
-                        ),
-                    ],
-                    className="mb-3",
-                ),
-                html.Div(id="geo-eco-plots"),
-                create_year_slider(min_year=1990, max_year=2021, default=2021),
-            ],
-            fluid=True,
-        )
+    return dbc.Container(
+        [
+            # Add Store component for data
+            dcc.Store(id="geo-eco-data"),
+            dcc.Store(id="sankey-data"),
+            dcc.Store(id="geo-eco-scatter-signature"),
+            dcc.Store(id="geo-eco-histogram-signature"),
+            dcc.Store(id="geo-eco-bar-signature"),
+            dbc.Container(
+                [
+                    dbc.Row(
+                        [
+                            create_plot_card("geo-eco-scatter", "GDP vs Death Rate"),
+                            create_plot_card(
+                                "geo-eco-histogram", None, header_id="geo-eco-histogram-header"
+                            ),
+                        ],
+                        className="mb-3",
+                    ),
+                    dbc.Row(
+                        [
+                            create_plot_card("geo-eco-bar", None, header_id="geo-eco-bar-header"),
+                            create_plot_card("geo-eco-sankey", "Sankey Diagram"),
+                        ]
+                    ),
+                ],
+                fluid=True,
+                style={
+                    "backgroundColor": "#f8f9fa",
+                    "padding": "15px",
+                    "borderRadius": "8px",
+                },
+            ),
+        ],
+        fluid=True,
     )
 
 
-@callback(
-    Output("geo-eco-plots", "children"),
+def load_metric_data(data, metric, gender, subset):
+    """Load the geo-eco Store with the selected metric column and no nulls in subset.
+
+    Returns the frame and metric column, or None and the message to show instead.
+    """
+    if not data or not metric or not gender:
+        return None, "Please select metric and gender"
+
+    df = load_store(data)
+    col = get_metric_column(gender, metric)
+    if not col or col not in df.columns:
+        return None, "Selected metric data not available"
+    return df.drop_nulls(subset=subset + [col]), col
+
+
+@tab_callback(
+    "geo-eco",
+    Output("geo-eco-histogram-header", "children"),
+    Output("geo-eco-bar-header", "children"),
+    Input("metric-dropdown", "value"),
+    Input("top-filter-slider", "value"),
+)
+def update_geo_eco_headers(metric, top_n):
+    """Update the card titles that name the metric and top N."""
+    return f"{metric} Distribution", f"{metric} Top {top_n} Countries"
+
+
+@tab_callback(
+    "geo-eco",
+    Output("geo-eco-scatter", "figure"),
+    Output("geo-eco-scatter-signature", "data"),
     Input("geo-eco-data", "data"),
-    Input("sankey-data", "data"),
     Input("metric-dropdown", "value"),
     Input("gender-dropdown", "value"),
     Input("top-filter-slider", "value"),
-    Input("year-slider", "value"),
+    State("geo-eco-scatter-signature", "data"),
 )
-def create_geo_eco_plots(data, sankey_data, metric, gender, top_n, year):
-    """Create a grid of plots using visualizations from visualisations.py."""
-    if not data or not metric or not gender:
-        print(
-            "Missing data:", not data, "Missing metric:", not metric, "Missing gender:", not gender
-        )
-        return html.Div("Please select metric and gender", style={"margin": "20px"})
+def update_geo_eco_scatter(data, metric, gender, top_n, signature):
+    """Update the GDP scatter plot."""
+    return incremental_figure(create_geo_eco_scatter(data, metric, gender, top_n), signature)
 
-    df = pl.DataFrame(data)
 
-    col = get_metric_column(gender, metric)
+@cached_figure("geo-eco-scatter")
+@offloaded
+def create_geo_eco_scatter(data, metric, gender, top_n):
+    """Build the GDP vs metric scatter plot for the top N countries."""
+    df, col = load_metric_data(data, metric, gender, ["gdp_pc"])
+    if df is None:
+        return create_no_data_figure(col).figure
+    return create_scatter_plot(
+        data=df,
+        x_metric="gdp_pc",
+        y_metric=col,
+        # gender="Both",
+        hue="WB_Income",
+        top_n=top_n,
+    ).figure
 
-    print("Metric column:", col)
-    if not col or col not in df.columns:
-        return html.Div("Selected metric data not available", style={"margin": "20px"})
-
-    # Create plots
-
-    return dcc.Loading(
-        dbc.Container(
-            [
-                dbc.Row(
-                    [
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardHeader(
-                                        html.H4("GDP vs Death Rate", className="text-center")
-                                    ),
-                                    dbc.CardBody(
-                                        create_scatter_plot(
-                                            data=df.filter(pl.col("Year").eq(year)).drop_nulls(
-                                                subset=["gdp_pc", col]
-                                            ),
-                                            x_metric="gdp_pc",
-                                            y_metric=col,
-                                            # gender="Both",
-                                            hue="WB_Income",
-                                            top_n=top_n,
-                                        ),
-                                        style={"height": "350px", "overflow": "auto"},
-                                    ),
-                                ],
-                                className="mb-3 shadow-sm",
-                            ),
-                            xs=12,
-                            sm=12,
-                            md=6,
-                            lg=6,
-                            xl=6,
-                        ),
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardHeader(
-                                        html.H4(f"{metric} Distribution", className="text-center")
-                                    ),
-                                    dbc.CardBody(
-                                        create_histogram_plot(
-                                            col,
-                                            df.filter(pl.col("Year").eq(year)).drop_nulls(
-                                                subset=[col]
-                                            ),
-                                        ),
-                                        style={"height": "350px", "overflow": "auto"},
-                                    ),
-                                ],
-                                className="mb-3 shadow-sm",
-                            ),
-                            xs=12,
-                            sm=12,
-                            md=6,
-                            lg=6,
-                            xl=6,
-                        ),
-                    ],
-                    className="mb-3",
-                ),
-                dbc.Row(
-                    [
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardHeader(
-                                        html.H4(f"{metric} Top {top_n} Countries", className="text-center")
-                                    ),
-                                    dbc.CardBody(
-                                        create_bar_plot(
-                                            col,
-                                            df.filter(pl.col("Year").eq(year)).drop_nulls(
-                                                subset=[col]
-                                            ),
-                                            top_n=top_n,
-                                        ),
-                                        style={"height": "350px", "overflow": "auto"},
-                                    ),
-                                ],
-                                className="mb-3 shadow-sm",
-                            ),
-                            xs=12,
-                            sm=12,
-                            md=6,
-                            lg=6,
-                            xl=6,
-                        ),
-                        dbc.Col(
-                            dbc.Card(
-                                [
-                                    dbc.CardHeader(
-                                        html.H4("Sankey Diagram", className="text-center")
-                                    ),
-                                    dbc.CardBody(
-                                        create_sankey_diagram(sankey_data, metric, gender),
-                                        style={"height": "350px", "overflow": "auto"},
-                                    ),
-                                ],
-                                className="mb-3 shadow-sm",
-                            ),
-                            xs=12,
-                            sm=12,
-                            md=6,
-                            lg=6,
-                            xl=6,
-                        ),
-                    ]
-                ),
-            ],
-            fluid=True,
-            style={
-                "backgroundColor": "#f8f9fa",
-                "padding": "15px",
-                "borderRadius": "8px",
-            },
-        ),
-        type="default",
-        color="#00AEF0",
-    )
+
+@tab_callback(
+    "geo-eco",
+    Output("geo-eco-histogram", "figure"),
+    Output("geo-eco-histogram-signature", "data"),
+    Input("geo-eco-data", "data"),
+    Input("metric-dropdown", "value"),
+    Input("gender-dropdown", "value"),
+    State("geo-eco-histogram-signature", "data"),
+)
+def update_geo_eco_histogram(data, metric, gender, signature):
+    """Update the metric distribution histogram."""
+    return incremental_figure(create_geo_eco_histogram(data, metric, gender), signature)
+
+
+@cached_figure("geo-eco-histogram")
+@offloaded
+def create_geo_eco_histogram(data, metric, gender):
+    """Build the histogram of the metric across countries."""
+    df, col = load_metric_data(data, metric, gender, [])
+    if df is None:
+        return create_no_data_figure(col).figure
+    return create_histogram_plot(col, df).figure
+
+
+@tab_callback(
+    "geo-eco",
+    Output("geo-eco-bar", "figure"),
+    Output("geo-eco-bar-signature", "data"),
+    Input("geo-eco-data", "data"),
+    Input("metric-dropdown", "value"),
+    Input("gender-dropdown", "value"),
+    Input("top-filter-slider", "value"),
+    State("geo-eco-bar-signature", "data"),
+)
+def update_geo_eco_bar(data, metric, gender, top_n, signature):
+    """Update the top N countries bar plot."""
+    return incremental_figure(create_geo_eco_bar(data, metric, gender, top_n), signature)
+
+
+@cached_figure("geo-eco-bar")
+@offloaded
+def create_geo_eco_bar(data, metric, gender, top_n):
+    """Build the bar plot of the top N countries for the metric."""
+    df, col = load_metric_data(data, metric, gender, [])
+    if df is None:
+        return create_no_data_figure(col).figure
+    return create_bar_plot(col, df, top_n=top_n).figure
+
+
+@tab_callback(
+    "geo-eco",
+    Output("geo-eco-sankey", "figure"),
+    Input("sankey-data", "data"),
+    Input("metric-dropdown", "value"),
+    Input("gender-dropdown", "value"),
+)
+@cached_figure("geo-eco-sankey")
+@offloaded
+def create_geo_eco_sankey(sankey_data, metric, gender):
+    """Build the Sankey diagram of income groups and metric levels."""
+    if not metric or not gender:
+        return create_no_data_figure("Please select metric and gender").figure
+    if not sankey_data:
+        return create_no_data_figure("No data available").figure
+    return create_sankey_diagram(load_store(sankey_data), metric, gender).figure
+
+
+@prefetch_warmer("geo-eco")
+def warm_geo_eco_year(year, regions, income, gender, metric, age, country, top_n):
+    """Compute and cache the geo-eco payloads and figures for one year."""
+    data = get_geo_eco_data(year, regions, income, gender, metric, age, country)
+    create_geo_eco_scatter(data, metric, gender, top_n)
+    create_geo_eco_histogram(data, metric, gender)
+    create_geo_eco_bar(data, metric, gender, top_n)
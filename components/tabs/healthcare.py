@@ -1,194 +1,222 @@
+import json
 import logging
+from types import MappingProxyType
+from typing import NamedTuple
 
 import dash_bootstrap_components as dbc
-import pandas as pd
+import plotly.io.json as plotly_json
 import polars as pl
-from dash import Input, Output, callback, dcc, html
+from dash import Input, Output, dcc, html
 
-from components.common.filter_slider import create_filter_slider
-from components.common.gender_metric_selector import get_metric_column
-from components.common.year_slider import create_year_slider
-from components.data.data import data_2019
-from components.visualisations import create_corr_matrix, create_scatter_plot
+from components.common.active_tab import tab_callback
+from components.common.background import offloaded
+from components.common.gender_metric_selector import GENDERS, METRIC_NAMES, get_metric_column
+from components.common.plots import create_plot_card
+from components.data.data import data_2019, get_healthcare_data, get_risk_data
+from components.data.figure_cache import cached_figure
+from components.data.prefetch import prefetch_warmer
+from components.data.store import load_store
+from components.visualisations import (
+    create_corr_matrix,
+    create_no_data_figure,
+    create_scatter_plot,
+)
 
 logger = logging.getLogger(__name__)
 
+BLOOD_PRESSURE_COLUMN = "t_high_bp_30-79"
+BLOOD_PRESSURE_TOP_N = 50
+
+
+class RiskView(NamedTuple):
+    """The 2019 risk-factor frames and finished figures for one gender and metric."""
+
+    frame: pl.DataFrame
+    top: pl.DataFrame
+    blood_pressure_figure: dict
+    risk_corr_figure: dict
+
+
+def to_json_figure(figure):
+    """Encode a figure once into the JSON-ready dict the callbacks return."""
+    return json.loads(plotly_json.to_json_plotly(figure))
+
+
+def build_risk_view(gender, metric):
+    """Cast, rank and plot the static 2019 slice for one gender and metric."""
+    metric_col = get_metric_column(gender, metric)
+    frame = (
+        data_2019.select("Entity", "WB_Income", BLOOD_PRESSURE_COLUMN, metric_col)
+        .with_columns(pl.col(BLOOD_PRESSURE_COLUMN, metric_col).cast(pl.Float64))
+        .drop_nulls(subset=[BLOOD_PRESSURE_COLUMN, metric_col])
+    )
+    top = frame.sort(metric_col, descending=True).limit(BLOOD_PRESSURE_TOP_N)
+    blood_pressure = create_scatter_plot(
+        data=top,
+        x_metric=BLOOD_PRESSURE_COLUMN,
+        y_metric=metric_col,
+        hue="WB_Income",
+        top_n=None,
+    )
+    risk_data = get_risk_data(gender, metric)
+    if risk_data is None:
+        risk_corr = create_no_data_figure("Please select metric and gender")
+    else:
+        risk_corr = create_corr_matrix(risk_data)
+    return RiskView(
+        frame=frame,
+        top=top,
+        blood_pressure_figure=to_json_figure(blood_pressure.figure),
+        risk_corr_figure=to_json_figure(risk_corr.figure),
+    )
+
+
+# data_2019 never changes, so every view is built once at startup and only read afterwards
+RISK_VIEWS = MappingProxyType(
+    {
+        (gender, metric): build_risk_view(gender, metric)
+        for gender in GENDERS
+        for metric in METRIC_NAMES
+    }
+)
+
 
 def create_healthcare_tab():
     """Function to display the layout for the healthcare tab with visualizations."""
-    return dcc.Loading(
-        html.Div(
-            [
-                dcc.Store(id="healthcare-data"),
-                dcc.Store(id="risk-data"),
-                create_filter_slider(),
-                html.Div(id="healthcare-plots"),
-                create_year_slider(),
-            ]
-        )
+    return html.Div(
+        [
+            dcc.Store(id="healthcare-data"),
+            dbc.Container(
+                html.Div(
+                    [
+                        dbc.Row(
+                            [
+                                create_plot_card("healthcare-obesity", "Obesity vs Death Rate"),
+                                create_plot_card("healthcare-risk-corr", "Risk Factor Correlation"),
+                            ],
+                            className="mb-3",
+                        ),
+                        dbc.Row(
+                            [
+                                create_plot_card(
+                                    "healthcare-blood-pressure", "High Blood Pressure"
+                                ),
+                                create_plot_card(
+                                    "healthcare-gender-comparison", "Male vs Female Comparison"
+                                ),
+                            ]
+                        ),
+                    ]
+                ),
+                fluid=True,
+                style={
+                    "backgroundColor": "#f8f9fa",
+                    "borderRadius": "8px",
+                    "padding": "15px",
+                },
+            ),
+        ]
     )
 
 
-@callback(
-    Output("healthcare-plots", "children"),
+def load_healthcare_data(data, metric, gender):
+    """Load the healthcare Store, or return None and the message to show instead."""
+    if not data or not metric or not gender:
+        return None, "Please select metric and gender"
+
+    # Convert data to Polars DataFrame
+    df = load_store(data)
+    logger.debug(f"first load view {df.head()}")
+    if df.is_empty():
+        return None, "No data available for the selected filters"
+
+    if not get_metric_column(gender, metric):
+        return None, "No metric data available"
+    return df, None
+
+
+@tab_callback(
+    "healthcare",
+    Output("healthcare-obesity", "figure"),
     Input("healthcare-data", "data"),
-    Input("risk-data", "data"),
     Input("gender-dropdown", "value"),
     Input("metric-dropdown", "value"),
     Input("top-filter-slider", "value"),
 )
-def create_healthcare_plots(data, risk_data, gender, metric, top_n):
-    """Create healthcare-related visualizations in a grid layout.
+@cached_figure("healthcare-obesity")
+@offloaded
+def create_obesity_plot(data, gender, metric, top_n):
+    """Build the obesity vs metric scatter plot for the top N countries."""
+    df, message = load_healthcare_data(data, metric, gender)
+    if df is None:
+        return create_no_data_figure(message).figure
 
-    Returns:
-        html.Div: A div containing a 2x2 grid of healthcare-related plots
-    """
-    if not data or not metric or not gender:
-        return html.Div("Please select metric and gender")
+    metric_col = get_metric_column(gender, metric)
+    return create_scatter_plot(
+        data=df.drop_nulls(subset=["obesity%", metric_col]),
+        x_metric="obesity%",
+        y_metric=metric_col,
+        top_n=top_n,
+        hue="WB_Income",
+    ).figure
 
-    # Convert data to Polars DataFrame
-    df = pl.DataFrame(data)
-    logger.debug(f"first load view {df.head()}")
-    if df.is_empty():
-        return html.Div("No data available for the selected filters")
 
-    metric_col = get_metric_column(gender, metric)
-    if not metric_col:
-        return html.Div("No metric data available")
-
-    hypertension = data_2019
-    logger.debug(f"first load view htn {hypertension.head()}")
-    risk_data = pl.DataFrame(risk_data)
-
-    return dcc.Loading(
-        dbc.Container(
-            html.Div(
-                [
-                    dbc.Row(
-                        [
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        dbc.CardHeader(
-                                            html.H4(
-                                                "Obesity vs Death Rate", className="text-center"
-                                            )
-                                        ),
-                                        dbc.CardBody(
-                                            create_scatter_plot(
-                                                data=df.drop_nulls(
-                                                    subset=["obesity%", metric_col]
-                                                ),
-                                                x_metric="obesity%",
-                                                y_metric=metric_col,
-                                                top_n=top_n,
-                                                hue="WB_Income",
-                                            ),
-                                            style={"height": "350px", "overflow": "auto"},
-                                        ),
-                                    ],
-                                    className="mb-3 shadow-sm",
-                                ),
-                                xs=12,
-                                sm=12,
-                                md=6,
-                                lg=6,
-                                xl=6,
-                            ),
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        dbc.CardHeader(
-                                            html.H4(
-                                                "Risk Factor Correlation",
-                                                className="text-center",
-                                            )
-                                        ),
-                                        dbc.CardBody(
-                                            create_corr_matrix(
-                                                risk_data  # data_2019.select(['obesity%','t_htn_ctrl','t_high_bp_30-79','pacemaker_1m','t_htn_diag','t_htn_rx_30-79', metric_col])
-                                            ),
-                                            style={"height": "350px", "overflow": "auto"},
-                                        ),
-                                    ],
-                                    className="mb-3 shadow-sm",
-                                ),
-                                xs=12,
-                                sm=12,
-                                md=6,
-                                lg=6,
-                                xl=6,
-                            ),
-                        ],
-                        className="mb-3",
-                    ),
-                    dbc.Row(
-                        [
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        dbc.CardHeader(
-                                            html.H4("High Blood Pressure", className="text-center")
-                                        ),
-                                        dbc.CardBody(
-                                            create_scatter_plot(
-                                                data=hypertension,
-                                                x_metric="t_high_bp_30-79",
-                                                y_metric=metric_col,
-                                                hue="WB_Income",
-                                                top_n=50,
-                                            ),
-                                            style={"height": "350px", "overflow": "auto"},
-                                        ),
-                                    ],
-                                    className="mb-3 shadow-sm",
-                                ),
-                                xs=12,
-                                sm=12,
-                                md=6,
-                                lg=6,
-                                xl=6,
-                            ),
-                            dbc.Col(
-                                dbc.Card(
-                                    [
-                                        dbc.CardHeader(
-                                            html.H4(
-                                                "Male vs Female Comparison",
-                                                className="text-center",
-                                            )
-                                        ),
-                                        dbc.CardBody(
-                                            create_scatter_plot(
-                                                data=df,
-                                                x_metric=get_metric_column("Female", metric),
-                                                y_metric=get_metric_column("Male", metric),
-                                                add_diagonal=True,
-                                                top_n=top_n,
-                                                hue="WB_Income",
-                                            ),
-                                            style={"height": "350px", "overflow": "auto"},
-                                        ),
-                                    ],
-                                    className="mb-3 shadow-sm",
-                                ),
-                                xs=12,
-                                sm=12,
-                                md=6,
-                                lg=6,
-                                xl=6,
-                            ),
-                        ]
-                    ),
-                ]
-            ),
-            fluid=True,
-            style={
-                "backgroundColor": "#f8f9fa",
-                "borderRadius": "8px",
-                "padding": "15px",
-            },
-        ),
-        type="default",
-        color="#00AEF0",
-    )
+@tab_callback(
+    "healthcare",
+    Output("healthcare-risk-corr", "figure"),
+    Input("gender-dropdown", "value"),
+    Input("metric-dropdown", "value"),
+)
+def create_risk_corr_plot(gender, metric):
+    """Serve the precomputed correlation matrix of the 2019 risk factors."""
+    view = RISK_VIEWS.get((gender, metric))
+    if view is None:
+        return create_no_data_figure("Please select metric and gender").figure
+    return view.risk_corr_figure
+
+
+@tab_callback(
+    "healthcare",
+    Output("healthcare-blood-pressure", "figure"),
+    Input("gender-dropdown", "value"),
+    Input("metric-dropdown", "value"),
+)
+def create_blood_pressure_plot(gender, metric):
+    """Serve the precomputed 2019 high blood pressure scatter plot."""
+    view = RISK_VIEWS.get((gender, metric))
+    if view is None:
+        return create_no_data_figure("No metric data available").figure
+    return view.blood_pressure_figure
+
+
+@tab_callback(
+    "healthcare",
+    Output("healthcare-gender-comparison", "figure"),
+    Input("healthcare-data", "data"),
+    Input("metric-dropdown", "value"),
+    Input("top-filter-slider", "value"),
+)
+@cached_figure("healthcare-gender-comparison")
+@offloaded
+def create_gender_comparison_plot(data, metric, top_n):
+    """Build the male vs female scatter plot for the top N countries."""
+    df, message = load_healthcare_data(data, metric, "Both")
+    if df is None:
+        return create_no_data_figure(message).figure
+
+    return create_scatter_plot(
+        data=df,
+        x_metric=get_metric_column("Female", metric),
+        y_metric=get_metric_column("Male", metric),
+        add_diagonal=True,
+        top_n=top_n,
+        hue="WB_Income",
+    ).figure
+
+
+@prefetch_warmer("healthcare")
+def warm_healthcare_year(year, regions, income, gender, metric, age, country, top_n):
+    """Compute and cache the healthcare payloads and figures for one year."""
+    data = get_healthcare_data(year, regions, income, gender, metric, age, country)
+    create_obesity_plot(data, gender, metric, top_n)
+    create_gender_comparison_plot(data, metric, top_n)
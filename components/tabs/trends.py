@@ -1,10 +1,11 @@
 import logging
 
 import dash_bootstrap_components as dbc
-import polars as pl
-from dash import Input, Output, callback, dcc, html
+from dash import Input, Output, dcc, html
 
+from components.common.active_tab import tab_callback
 from components.common.gender_metric_selector import get_metric_column
+from components.data.store import load_store
 from components.visualisations import create_trend_plot
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,8 @@ def create_trends_tab():
     )
 
 
-@callback(
+@tab_callback(
+    "trends",
     Output("trend-plots", "children"),
     Input("trends-data", "data"),
     Input("metric-dropdown", "value"),
@@ -46,7 +48,7 @@ def update_trend_plots(trends_data, metric, gender):
     if not trends_data or not metric or not gender:
         return html.Div("No Data")
 
-    df = pl.DataFrame(trends_data)
+    df = load_store(trends_data)
 
     return dcc.Loading(
         create_trend_plot(df, metric, gender),
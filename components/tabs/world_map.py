@@ -1,22 +1,29 @@
 import logging
 
 import dash_bootstrap_components as dbc
-import pandas as pd
-from dash import Input, Output, State, callback, dcc, html, no_update
+from dash import Input, Output, State, dcc, html, no_update
 
 logger = logging.getLogger(__name__)
 
 
-from components.common.year_slider import create_year_slider
-from components.visualisations import create_chloropleth_map, create_tooltip
+from components.common.active_tab import tab_callback
+from components.common.patches import incremental_figure
+from components.data.data import get_world_map_frames
+from components.data.figure_cache import cached_figure
+from components.data.store import load_store
+from components.visualisations import (
+    create_animated_chloropleth_map,
+    create_chloropleth_map,
+    create_tooltip,
+)
 
 
 def create_world_map_tab():
     """Create the world map tab with choropleth map and year slider."""
     return html.Div(
         [
-            dcc.Store(id="general-data"),
             dcc.Store(id="world-map-data"),
+            dcc.Store(id="chloropleth-map-signature"),
             html.Div(
                 [
                     html.H2(
@@ -44,9 +51,11 @@ def create_world_map_tab():
                         ),
                         style={"position": "relative", "width": "100%", "height": "100%"},
                     ),
-                    html.Div(
-                        create_year_slider(),
-                        style={"height": "50px", "marginTop": "2px"},
+                    dbc.Switch(
+                        id="map-animation-switch",
+                        label="Play all years in the browser",
+                        value=False,
+                        style={"marginLeft": "15px"},
                     ),
                 ],
                 id="world-map-container",
@@ -61,36 +70,121 @@ def create_world_map_tab():
     )
 
 
-@callback(
+@tab_callback(
+    "world-map",
     Output("map-title", "children"),
     Input("year-slider", "value"),
     Input("metric-dropdown", "value"),
     Input("gender-dropdown", "value"),
+    Input("map-animation-switch", "value"),
 )
-def update_map_title(year, metric, gender):
-    """Update the map title based on selected year and metric."""
+def update_map_title(year, metric, gender, animated):
+    """Update the map title based on selected year and metric.
+
+    While the map animates in the browser the slider year is not the one shown,
+    so the title leaves the year out.
+    """
     gender = ": " + gender if gender != "Both" else ""
-    if not year or not metric:
+    if not metric or (not year and not animated):
         return ""
+    if animated:
+        return f"{metric} by year {gender}"
     return f"{metric} for {year} {gender}"
 
 
-@callback(
+@tab_callback(
+    "world-map",
     Output("chloropleth-map", "figure"),
+    Output("chloropleth-map-signature", "data"),
     Input("world-map-data", "data"),
     Input("metric-dropdown", "value"),
     Input("gender-dropdown", "value"),
+    Input("map-animation-switch", "value"),
+    State("chloropleth-map-signature", "data"),
+)
+def update_map(filtered_data, metric, gender, animated, signature):
+    """Update the choropleth map based on filtered data.
+
+    When the countries shown are unchanged, only the values are sent as a patch.
+    """
+    if animated:
+        # The animated figure already holds every year; leave it to play in the browser
+        return no_update, no_update
+    return incremental_figure(build_map(filtered_data, metric, gender), signature)
+
+
+@tab_callback(
+    "world-map",
+    Output("chloropleth-map", "figure", allow_duplicate=True),
+    Output("chloropleth-map-signature", "data", allow_duplicate=True),
+    Input("map-animation-switch", "value"),
+    Input("region-dropdown", "value"),
+    Input("income-dropdown", "value"),
+    Input("gender-dropdown", "value"),
+    Input("metric-dropdown", "value"),
+    Input("age-dropdown", "value"),
+    State("year-slider", "value"),
+    prevent_initial_call=True,
 )
-def update_map(filtered_data, metric, gender):
-    """Update the choropleth map based on filtered data."""
+def update_animated_map(animated, regions, income, gender, metric, age, year):
+    """Send the whole year range once as an animated map when playback runs client-side.
+
+    The signature is cleared with it, so the next static map is sent in full.
+    """
+    if not animated:
+        return no_update, no_update
+    figure = build_animated_map(regions, income, gender, metric, age)
+    return start_animated_map(figure, year), None
+
+
+@cached_figure("chloropleth-animation")
+def build_animated_map(regions, income, gender, metric, age):
+    """Build the animated choropleth map for every year of the selection.
+
+    The cached figure opens on the last year; start_animated_map moves it to
+    the year the slider is on.
+    """
+    if not metric or not gender:
+        return create_empty_message("Please select metric and gender")
+    if not age:
+        return create_empty_message("Please select an age group to animate")
+
+    frame_data = get_world_map_frames(regions, income, gender, metric, age)
+    return create_animated_chloropleth_map(frame_data, metric, gender)
+
+
+def start_animated_map(figure, year):
+    """Return a copy of a cached animated map that opens on the frame of year.
+
+    Only the shown trace and the slider position are replaced; the frames are
+    shared with the cached figure. Years without a frame open on the last one.
+    """
+    frames = figure.get("frames")
+    if not frames:
+        return figure
+    names = [frame["name"] for frame in frames]
+    start = names.index(str(year)) if str(year) in names else len(names) - 1
+    trace = {**figure["data"][0], "z": frames[start]["data"][0]["z"]}
+    layout = figure["layout"]
+    sliders = [{**layout["sliders"][0], "active": start}] + layout["sliders"][1:]
+    return {
+        **figure,
+        "data": [trace] + figure["data"][1:],
+        "layout": {**layout, "sliders": sliders},
+    }
+
+
+@cached_figure("chloropleth-map")
+def build_map(filtered_data, metric, gender):
+    """Build the choropleth map for the selected year."""
     if not filtered_data or not metric or not gender:
         return create_empty_message("Please select metric and gender")
 
-    df = pd.DataFrame(filtered_data)
-    if df.empty:
+    df = load_store(filtered_data)
+    if df.is_empty():
         return create_empty_message("No data available for the selected filters")
 
-    return create_chloropleth_map(filtered_data, metric, gender)
+    return create_chloropleth_map(df, metric, gender)
 
 
 def create_empty_message(message):
@@ -114,7 +208,8 @@ def create_empty_message(message):
     }
 
 
-@callback(
+@tab_callback(
+    "world-map",
     Output("graph-tooltip", "show"),
     Output("graph-tooltip", "bbox"),
     Output("graph-tooltip", "children"),
@@ -130,8 +225,13 @@ def display_hover(hover_data, metric, gender, year, age):
         return False, no_update, no_update
 
     pt = hover_data["points"][0]
-    country_name = pt["location"]
+    children = build_tooltip(pt["location"], metric, gender, age, year)
+    return True, pt["bbox"], children
+
 
+@cached_figure("graph-tooltip")
+def build_tooltip(country_name, metric, gender, age, year):
+    """Build the tooltip content for one country, cached per entity and selection."""
     fig, risk_factors = create_tooltip(country_name, metric, gender, age, year)
 
     if fig is None:
@@ -176,5 +276,4 @@ def display_hover(hover_data, metric, gender, year, age):
             ),
         ]
 
-    bbox = pt["bbox"]
-    return True, bbox, children
+    return children
@@ -1,10 +1,10 @@
 import logging
+import math
 from collections import OrderedDict
 from functools import lru_cache
 
 import dash_bootstrap_components as dbc
 import numpy as np
-import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import polars as pl
@@ -14,8 +14,15 @@ from scipy.stats import t
 from statsmodels.nonparametric.smoothers_lowess import lowess
 
 from components.common import gender_metric_selector
+from components.common.quantize import quantize_figure
 from components.common.gender_metric_selector import get_metric_column
-from components.data.data import UNIQUE_INCOMES, UNIQUE_REGIONS, data
+from components.data.data import (
+    CVD_CAUSE,
+    UNIQUE_INCOMES,
+    UNIQUE_REGIONS,
+    code_eq,
+    get_entity_rows,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,26 @@ COMMON_LAYOUT = {
 }
 
 
+MAP_GEO = dict(
+    showframe=False,
+    showcoastlines=True,
+    projection_type="equirectangular",
+    showocean=True,
+    oceancolor="rgba(0,0,0,0)",
+    showland=True,
+    landcolor="rgba(0,0,0,0)",
+    showlakes=True,
+    lakecolor="rgba(0,0,0,0)",
+    showrivers=True,
+    rivercolor="rgba(0,0,0,0)",
+    showcountries=True,
+    countrycolor="gray",
+    countrywidth=0.5,
+    showsubunits=True,
+    subunitcolor="gray",
+    subunitwidth=0.5,
+)
+
 GRID_SETTINGS = {"gridwidth": 1, "gridcolor": "rgba(128,128,128,0.1)", "zeroline": False}
 
 
@@ -133,14 +160,14 @@ def create_scatter_plot(
     for axis in [fig.update_xaxes, fig.update_yaxes]:
         axis(**GRID_SETTINGS)
 
+    quantize_figure(fig, "create_scatter_plot")
     return dcc.Graph(figure=fig, style={"height": "100%"}, config={"displayModeBar": False})
 
 
 def create_tooltip(country_name, metric, gender, age, selected_year=None):
     """Create a tooltip with time series plot and risk factors for a country."""
-    # Get data for the country
-    df = data
-    df = df.filter(pl.col("Entity").eq(country_name))
+    # Get data for the country from its pre-sorted slice
+    df = get_entity_rows(country_name)
 
     if df.height == 0:
         return create_no_data_figure("No data available for this country"), {}
@@ -152,8 +179,8 @@ def create_tooltip(country_name, metric, gender, age, selected_year=None):
 
     # Create time series plot for cardiovascular diseases
     cv_df = df.filter(
-        (pl.col("cause").str.to_lowercase().eq("cardiovascular diseases"))
-        & (pl.col("age").eq(age))
+        code_eq("cause", CVD_CAUSE)
+        & code_eq("age", age)
     )
     cv_df = cv_df.drop_nulls(subset=[col])
 
@@ -163,11 +190,11 @@ def create_tooltip(country_name, metric, gender, age, selected_year=None):
     fig = go.Figure()
 
     # Add main time series
-    cv_df_pd = cv_df.sort("Year").to_pandas()
+    cv_df = cv_df.sort("Year")
     fig.add_trace(
         go.Scatter(
-            x=cv_df_pd["Year"],
-            y=cv_df_pd[col],
+            x=cv_df["Year"].to_numpy(),
+            y=cv_df[col].to_numpy(),
             mode="lines+markers",
             name="Actual",
         )
@@ -203,8 +230,8 @@ def create_tooltip(country_name, metric, gender, age, selected_year=None):
         # Add other causes
         other_causes = df.filter(
             (pl.col("Year").eq(selected_year))
-            & ~(pl.col("cause").str.to_lowercase().str.contains("cardiovascular diseases"))
-            & (pl.col("age").eq(age))
+            & ~code_eq("cause", CVD_CAUSE)
+            & code_eq("age", age)
         )
         other_causes = other_causes.drop_nulls(subset=[col])
 
@@ -213,6 +240,7 @@ def create_tooltip(country_name, metric, gender, age, selected_year=None):
         for row in other_causes.iter_rows(named=True):
             risk_factors[row["cause"]] = format_value(row[col], is_percent=is_percent)
 
+    quantize_figure(fig, "create_tooltip")
     return fig, risk_factors
 
 
@@ -291,6 +319,7 @@ def create_trend_plot(data, metric, gender):
         hovermode="x unified",
     )
 
+    quantize_figure(fig, "create_trend_plot")
     return dcc.Graph(figure=fig, config={"displayModeBar": False})
 
 
@@ -306,7 +335,7 @@ def format_value(value, is_percent=True, is_estimate=True, is_obesity=False):
     Returns:
         str: Formatted value
     """
-    if pd.isna(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
         return "N/A"
 
     try:
@@ -359,7 +388,7 @@ def create_line_plot(metric, data, top_n=5, n_metric=None):
     filtered_data = filtered_data.filter(pl.col("Entity").is_in(top_entities))
 
     fig = px.line(
-        filtered_data.to_pandas(),
+        filtered_data,
         x="Year",
         y=metric,
         color="Entity",
@@ -387,6 +416,7 @@ def create_line_plot(metric, data, top_n=5, n_metric=None):
     for axis in [fig.update_xaxes, fig.update_yaxes]:
         axis(**GRID_SETTINGS)
 
+    quantize_figure(fig, "create_line_plot")
     return dcc.Graph(figure=fig, style={"height": "100%"}, config={"displayModeBar": False})
 
 
@@ -395,13 +425,11 @@ def create_bar_plot(metric, data, top_n=5, color=None):
 
     Args:
         metric (str): Column to plot
-        data (pd.DataFrame): Data to plot
+        data (pl.DataFrame): Data to plot
         top_n (int, optional): Number of top entries to show. Defaults to 5.
         color (str, optional): Column to use for color coding. Defaults to None.
     """
-    if isinstance(data, pd.DataFrame):
-        df = pl.from_pandas(data)
-    elif isinstance(data, (list, dict)):
+    if isinstance(data, (list, dict)):
         df = pl.DataFrame(data)
     else:
         df = data
@@ -413,7 +441,7 @@ def create_bar_plot(metric, data, top_n=5, color=None):
     df = df.sort(metric, descending=True).limit(top_n)
 
     fig = px.bar(
-        data_frame=df.to_pandas(),
+        data_frame=df,
         x="Entity",
         y=metric,
         color=color,
@@ -440,14 +468,38 @@ def create_bar_plot(metric, data, top_n=5, color=None):
     for axis in [fig.update_xaxes, fig.update_yaxes]:
         axis(**GRID_SETTINGS)
 
+    quantize_figure(fig, "create_bar_plot")
     return dcc.Graph(figure=fig, style={"height": "100%"}, config={"displayModeBar": False})
 
 
+def create_chloropleth_trace(locations, values, metric, scale_max):
+    """Create the choropleth trace shared by the static and animated world maps."""
+    return go.Choropleth(
+        locations=locations,
+        locationmode="country names",
+        z=values,
+        text=None,
+        colorscale="RdYlBu_r",  # Changed to a more intuitive red-yellow-blue scale
+        autocolorscale=False,
+        zmin=0,  # Start from 0 for better context
+        zmax=scale_max,  # Use rounded max
+        marker_line_color="darkgray",
+        marker_line_width=0.5,
+        colorbar=dict(
+            title=dict(text=get_title_text(metric), side="right", font=dict(size=12)),
+            thickness=15,
+            len=0.9,
+            tickformat=".0f",
+            outlinewidth=0,
+        ),
+    )
+
+
 def create_chloropleth_map(filtered_data, metric, gender="Both"):
     """Create a choropleth map visualization from filtered data.
 
     Args:
-        filtered_data (list): List of dictionaries containing filtered data
+        filtered_data (pl.DataFrame | list): Filtered data, as a frame or list of row dicts
         metric (str): Selected metric name
         gender (str, optional): Selected gender. Defaults to "Both".
 
@@ -455,9 +507,8 @@ def create_chloropleth_map(filtered_data, metric, gender="Both"):
         plotly.graph_objects.Figure: The choropleth map figure
     """
 
-    # Convert list of dicts to DataFrame
-    df = pd.DataFrame(filtered_data)
-    if df.empty:
+    df = filtered_data if isinstance(filtered_data, pl.DataFrame) else pl.DataFrame(filtered_data)
+    if df.is_empty():
         return create_no_data_figure("No data available for selected filters")
 
     # Get the appropriate column based on metric and gender
@@ -465,32 +516,16 @@ def create_chloropleth_map(filtered_data, metric, gender="Both"):
     if not metric_col:
         return create_no_data_figure("No data available for selected filters")
 
-    df[metric_col] = pd.to_numeric(df[metric_col], errors="coerce")
+    values = df[metric_col].cast(pl.Float64, strict=False)
 
     # Create figure
     # Calculate rounded max value for better scale
-    data_max = df[metric_col].max()
+    data_max = values.max()
     scale_max = round(data_max / 100) * 100  # Round to nearest hundred
 
     fig = go.Figure(
-        data=go.Choropleth(
-            locations=df["Entity"],
-            locationmode="country names",
-            z=df[metric_col],
-            text=None,
-            colorscale="RdYlBu_r",  # Changed to a more intuitive red-yellow-blue scale
-            autocolorscale=False,
-            zmin=0,  # Start from 0 for better context
-            zmax=scale_max,  # Use rounded max
-            marker_line_color="darkgray",
-            marker_line_width=0.5,
-            colorbar=dict(
-                title=dict(text=get_title_text(metric), side="right", font=dict(size=12)),
-                thickness=15,
-                len=0.9,
-                tickformat=".0f",
-                outlinewidth=0,
-            ),
+        data=create_chloropleth_trace(
+            df["Entity"].cast(pl.Utf8).to_numpy(), values.to_numpy(), metric, scale_max
         )
     )
 
@@ -498,95 +533,197 @@ def create_chloropleth_map(filtered_data, metric, gender="Both"):
         **COMMON_LAYOUT,
         margin={"r": 0, "t": 0, "l": 0, "b": 0},
         height=None,
-        geo=dict(
-            showframe=False,
-            showcoastlines=True,
-            projection_type="equirectangular",
-            showocean=True,
-            oceancolor="rgba(0,0,0,0)",
-            showland=True,
-            landcolor="rgba(0,0,0,0)",
-            showlakes=True,
-            lakecolor="rgba(0,0,0,0)",
-            showrivers=True,
-            rivercolor="rgba(0,0,0,0)",
-            showcountries=True,
-            countrycolor="gray",
-            countrywidth=0.5,
-            showsubunits=True,
-            subunitcolor="gray",
-            subunitwidth=0.5,
-        ),
+        geo=MAP_GEO,
     )
 
+    quantize_figure(fig, "create_chloropleth_map")
     return fig
 
 
+def create_animated_chloropleth_map(frame_data, metric, gender="Both", year=None):
+    """Create a choropleth map that plays through every year in the browser.
+
+    All years share one set of locations, so each animation frame only carries
+    the z array of its year and the country geometry is sent once.
+
+    Args:
+        frame_data (pl.DataFrame): Year, Entity and metric rows for every year
+        metric (str): Selected metric name
+        gender (str, optional): Selected gender. Defaults to "Both".
+        year (int, optional): Year shown before playback starts. Defaults to the last year.
+
+    Returns:
+        plotly.graph_objects.Figure: The animated choropleth map figure
+    """
+    metric_col = get_metric_column(gender, metric)
+    if frame_data is None or frame_data.is_empty() or not metric_col:
+        return create_no_data_figure("No data available for selected filters")
+
+    entities, entity_pos = np.unique(
+        frame_data["Entity"].cast(pl.Utf8).to_numpy(), return_inverse=True
+    )
+    years, year_pos = np.unique(frame_data["Year"].to_numpy(), return_inverse=True)
+    z = np.full((len(years), len(entities)), np.nan)
+    z[year_pos, entity_pos] = frame_data[metric_col].cast(pl.Float64).to_numpy()
+
+    # One colour scale across all years so frames stay comparable
+    scale_max = round(np.nanmax(z) / 100) * 100
+    start = int(np.searchsorted(years, year)) if year in years else len(years) - 1
+    names = [str(y) for y in years]
+
+    fig = go.Figure(
+        data=create_chloropleth_trace(entities, z[start], metric, scale_max),
+        frames=[go.Frame(data=[go.Choropleth(z=row)], name=name) for row, name in zip(z, names)],
+    )
+
+    play_args = {"frame": {"duration": 500, "redraw": True}, "transition": {"duration": 0}}
+    pause_args = {"frame": {"duration": 0, "redraw": False}, "mode": "immediate"}
+    seek_args = {"frame": {"duration": 0, "redraw": True}, "mode": "immediate"}
+    fig.update_layout(
+        **COMMON_LAYOUT,
+        margin={"r": 0, "t": 0, "l": 0, "b": 0},
+        height=None,
+        geo=MAP_GEO,
+        updatemenus=[
+            dict(
+                type="buttons",
+                direction="left",
+                x=0,
+                y=0,
+                xanchor="left",
+                yanchor="top",
+                pad={"t": 30},
+                showactive=False,
+                buttons=[
+                    dict(
+                        label="▶️",
+                        method="animate",
+                        args=[None, {**play_args, "fromcurrent": True}],
+                    ),
+                    dict(label="⏸️", method="animate", args=[[None], pause_args]),
+                ],
+            )
+        ],
+        sliders=[
+            dict(
+                active=start,
+                x=0.1,
+                len=0.9,
+                y=0,
+                yanchor="top",
+                pad={"t": 20},
+                currentvalue={"prefix": "Year: "},
+                steps=[
+                    dict(label=name, method="animate", args=[[name], seek_args]) for name in names
+                ],
+            )
+        ],
+    )
+
+    quantize_figure(fig, "create_animated_chloropleth_map")
+    return fig
+
+
+def bin_labels(col, edges, labels, include_lowest=True):
+    """Expression labelling a column by right-closed bins (e0, e1], (e1, e2], ...
+
+    Values outside the edges get no label, like pd.cut. With include_lowest the
+    first bin also holds e0.
+    """
+    value = pl.col(col)
+    below = value < edges[0] if include_lowest else value <= edges[0]
+    expr = pl.when(value.is_null() | below | (value > edges[-1])).then(None)
+    for upper, label in zip(edges[1:], labels):
+        expr = expr.when(value <= upper).then(pl.lit(label))
+    return expr.otherwise(None)
+
+
+def metric_range_bins(values, title):
+    """Bin edges and labels for the Sankey metric ranges.
+
+    Mirrors pd.qcut(q=4, duplicates="drop") on the quartiles and, when two
+    quartile edges coincide, pd.cut on bins around the mean, which leaves the
+    minimum out. Returns (edges, labels, include_lowest), or None when the
+    fallback edges do not strictly increase and pd.cut would reject them.
+    """
+    quartiles = [values.quantile(q, interpolation="linear") for q in (0, 0.25, 0.5, 0.75, 1)]
+    if len(set(quartiles)) == len(quartiles):
+        labels = [f"{title} ({i}%)" for i in ["0-25", "25-50", "50-75", "75-100"]]
+        return quartiles, labels, True
+
+    mean = values.mean()
+    edges = [values.min(), mean / 2, mean, mean * 1.5, values.max()]
+    if any(lower >= upper for lower, upper in zip(edges, edges[1:])):
+        return None
+    labels = [
+        f"{title} (Low)",
+        f"{title} (Medium-Low)",
+        f"{title} (Medium-High)",
+        f"{title} (High)",
+    ]
+    return edges, labels, False
+
+
 def create_sankey_diagram(data, metric, gender):
     """Create a Sankey diagram showing flow between Region -> Income -> Metric Ranges."""
-    df = pd.DataFrame(data)
+    df = data if isinstance(data, pl.DataFrame) else pl.DataFrame(data)
     # df = data
-    if df.empty:
+    if df.is_empty():
         return create_no_data_figure("No data available")
 
     metric = get_metric_column(gender, metric)
 
     # df = data
-    logger.debug(msg=df.columns.tolist())
-    df[metric] = df[metric].astype(float)
-    print(df.dtypes)
+    logger.debug(msg=df.columns)
+    df = df.with_columns(pl.col(metric).cast(pl.Float64))
 
-    if df.empty:
+    if df.is_empty():
         return create_no_data_figure("No data available")
 
-    try:
-        labels = [f"{get_title_text(metric)} ({i}%)" for i in ["0-25", "25-50", "50-75", "75-100"]]
-        df["metric_range"] = pd.qcut(df[metric], q=4, labels=labels, duplicates="drop")
-    except ValueError:
-        bins = [
-            df[metric].min(),
-            df[metric].mean() / 2,
-            df[metric].mean(),
-            df[metric].mean() * 1.5,
-            df[metric].max(),
-        ]
-        labels = [
-            f"{get_title_text(metric)} (Low)",
-            f"{get_title_text(metric)} (Medium-Low)",
-            f"{get_title_text(metric)} (Medium-High)",
-            f"{get_title_text(metric)} (High)",
-        ]
-        df["metric_range"] = pd.cut(df[metric], bins=bins, labels=labels, duplicates="drop")
+    bins = metric_range_bins(df[metric], get_title_text(metric))
+    if bins is None:
+        return create_no_data_figure("Not enough distinct values to group into ranges")
+    edges, labels, include_lowest = bins
+    df = df.with_columns(bin_labels(metric, edges, labels, include_lowest).alias("metric_range"))
 
-    regions = df["region"].unique().tolist()
-    incomes = df["WB_Income"].unique().tolist()
-    ranges = df["metric_range"].unique().tolist()
+    df = df.with_columns(pl.col("region", "WB_Income").cast(pl.Utf8))
+    regions = df["region"].unique(maintain_order=True).to_list()
+    incomes = df["WB_Income"].unique(maintain_order=True).to_list()
+    ranges = df["metric_range"].drop_nulls().unique(maintain_order=True).to_list()
     nodes = regions + incomes + ranges
     sources, targets, values = [], [], []
     link_colors = []
 
+    # Link sizes are row counts per (source, target) pair
+    region_income = {
+        (region, income): count
+        for region, income, count in df.group_by(["region", "WB_Income"]).len().iter_rows()
+    }
+    income_range = {
+        (income, range_val): count
+        for income, range_val, count in df.group_by(["WB_Income", "metric_range"]).len().iter_rows()
+    }
+
     for region in regions:
         region_idx = nodes.index(region)
-        region_data = df[df["region"] == region]
         for income in incomes:
             income_idx = nodes.index(income)
-            income_data = region_data[region_data["WB_Income"] == income]
-            if not income_data.empty:
+            count = region_income.get((region, income))
+            if count:
                 sources.append(region_idx)
                 targets.append(income_idx)
-                values.append(len(income_data))
+                values.append(count)
                 link_colors.append("rgba(31, 119, 180, 0.4)")  # Light blue
 
     for income in incomes:
         income_idx = nodes.index(income)
-        income_data = df[df["WB_Income"] == income]
         for range_val in ranges:
             range_idx = nodes.index(range_val)
-            range_data = income_data[income_data["metric_range"] == range_val]
-            if not range_data.empty:
+            count = income_range.get((income, range_val))
+            if count:
                 sources.append(income_idx)
                 targets.append(range_idx)
-                values.append(len(range_data))
+                values.append(count)
                 link_colors.append("rgba(44, 160, 44, 0.4)")  # Light green
 
     node_colors = (
@@ -640,8 +777,7 @@ def create_histogram_plot(metric: str, data: pl.DataFrame, bins: int = 30) -> go
 
     title = get_title_text(metric)
 
-    # Convert to pandas for plotly compatibility
-    df = data.select([metric]).to_pandas()
+    df = data.select([metric])
 
     # Create histogram
     fig = px.histogram(df, x=metric, nbins=bins, title=title, labels={metric: title}, opacity=0.75)
@@ -667,6 +803,7 @@ def create_histogram_plot(metric: str, data: pl.DataFrame, bins: int = 30) -> go
         annotation_position="top right",
     )
 
+    quantize_figure(fig, "create_histogram_plot")
     return dcc.Graph(figure=fig, style={"height": "100%"}, config={"displayModeBar": False})
 
 
@@ -687,4 +824,5 @@ def create_corr_matrix(data: pl.DataFrame) -> dcc.Graph:
             font=dict(size=14),
         ),
     )
+    quantize_figure(fig, "create_corr_matrix")
     return dcc.Graph(figure=fig, style={"height": "100%"}, config={"displayModeBar": False})
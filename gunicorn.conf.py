@@ -0,0 +1,149 @@
+"""Gunicorn settings for the dashboard.
+
+The master makes sure the Arrow data snapshot is built before forking, and
+every worker memory-maps that same file, so the frame and the partition slices
+built over it live once in the page cache rather than in each worker's heap.
+Set SHARED_SNAPSHOT_DIR (for example /dev/shm) to map a copy in shared memory
+instead, when the data directory is on slow or network storage. The master
+never imports Polars: forking after the Polars thread pool has started can
+deadlock the workers. Each worker logs the hit, miss, stampede and wait
+counters of its query caches when it exits.
+
+The query and figure caches, and so the year prefetch that fills them, are
+per worker. Set WEB_CONCURRENCY=1 and GUNICORN_THREADS>1 to have one warm cache
+serve every request. With BACKGROUND_CALLBACKS on, the settings below
+always run one worker with several threads.
+"""
+
+import contextlib
+import logging
+import os
+import shutil
+import subprocess
+import sys
+
+logger = logging.getLogger("gunicorn.error")
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(APP_DIR, "data", "heart_processed.csv")
+SNAPSHOT_PATH = os.path.join(APP_DIR, "data", "heart_processed.arrow")
+SHARED_SNAPSHOT_DIR = os.getenv("SHARED_SNAPSHOT_DIR", "")
+# Free space to leave in the shared-memory filesystem after the copy
+SHARED_SNAPSHOT_HEADROOM = 64 * 1024 * 1024
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+threads = int(os.getenv("GUNICORN_THREADS", "1"))
+# Same switch as components.common.background, read here to keep the master light
+BACKGROUND_CALLBACKS = os.getenv("BACKGROUND_CALLBACKS", "false").lower() in ("1", "true", "yes")
+if BACKGROUND_CALLBACKS:
+    # The job pool and each client's latest job live in one process: a newer
+    # request can only supersede an older one it shares a worker with, and
+    # every worker would spawn its own pool. Keep the concurrency as threads.
+    workers, threads = 1, max(threads, workers, 2)
+# Share the data through the mapped segment instead of preloading the app
+preload_app = False
+
+
+def memory_usage():
+    """Return RSS, PSS and shared memory in MiB for the current process."""
+    usage = {}
+    try:
+        with open("/proc/self/smaps_rollup") as smaps:
+            for line in smaps:
+                key, _, value = line.partition(":")
+                if key in ("Rss", "Pss", "Shared_Clean", "Shared_Dirty"):
+                    usage[key] = int(value.split()[0]) / 1024
+    except OSError:
+        return {}
+    return {
+        "rss": usage.get("Rss", 0.0),
+        "pss": usage.get("Pss", 0.0),
+        "shared": usage.get("Shared_Clean", 0.0) + usage.get("Shared_Dirty", 0.0),
+    }
+
+
+def format_memory(usage):
+    if not usage:
+        return "memory usage unavailable"
+    return "RSS=%.1f MiB PSS=%.1f MiB shared=%.1f MiB" % (
+        usage["rss"],
+        usage["pss"],
+        usage["shared"],
+    )
+
+
+def build_snapshot():
+    """Build the snapshot if it is missing or older than the CSV."""
+    stale = not os.path.exists(SNAPSHOT_PATH) or (
+        os.path.exists(CSV_PATH) and os.path.getmtime(SNAPSHOT_PATH) < os.path.getmtime(CSV_PATH)
+    )
+    if stale:
+        # Build in a child process so the master stays free of Polars threads
+        subprocess.run([sys.executable, "-c", "import components.data.data"], cwd=APP_DIR, check=True)
+
+
+def share_snapshot():
+    """Point the workers at the snapshot, copied into SHARED_SNAPSHOT_DIR if configured.
+
+    When the copy is not possible the workers map the snapshot where it is.
+    """
+    build_snapshot()
+    if not SHARED_SNAPSHOT_DIR:
+        logger.info("Workers map data snapshot %s", SNAPSHOT_PATH)
+        return
+    if not os.path.isdir(SHARED_SNAPSHOT_DIR):
+        logger.warning("%s not available, workers map %s", SHARED_SNAPSHOT_DIR, SNAPSHOT_PATH)
+        return
+
+    shared_path = os.path.join(SHARED_SNAPSHOT_DIR, os.path.basename(SNAPSHOT_PATH))
+    tmp_path = f"{shared_path}.{os.getpid()}.tmp"
+    try:
+        needed = os.path.getsize(SNAPSHOT_PATH) + SHARED_SNAPSHOT_HEADROOM
+        if os.path.exists(shared_path):
+            # The old copy is replaced, so its space becomes free again
+            needed -= os.path.getsize(shared_path)
+        free = shutil.disk_usage(SHARED_SNAPSHOT_DIR).free
+        if free < needed:
+            logger.warning(
+                "%s has %.1f MiB free, %.1f MiB needed; workers map %s",
+                SHARED_SNAPSHOT_DIR,
+                free / 2**20,
+                needed / 2**20,
+                SNAPSHOT_PATH,
+            )
+            return
+        # copy2 keeps the mtime, so the snapshot is still compared against the CSV
+        shutil.copy2(SNAPSHOT_PATH, tmp_path)
+        os.replace(tmp_path, shared_path)
+    except OSError:
+        logger.exception(
+            "Could not copy the snapshot to %s, workers map %s", SHARED_SNAPSHOT_DIR, SNAPSHOT_PATH
+        )
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        return
+    os.environ["DATA_SNAPSHOT_PATH"] = shared_path
+    logger.info("Shared data snapshot at %s", shared_path)
+
+
+def on_starting(server):
+    if BACKGROUND_CALLBACKS:
+        logger.info("Background callbacks on: 1 worker with %d threads", threads)
+    share_snapshot()
+
+
+def when_ready(server):
+    logger.info("Master %s ready: %s", os.getpid(), format_memory(memory_usage()))
+
+
+def post_worker_init(worker):
+    logger.info("Worker %s loaded: %s", worker.pid, format_memory(memory_usage()))
+
+
+def worker_exit(server, worker):
+    # Runs in the worker, which already imported the caches with the app
+    from components.data.cache import cache_stats
+
+    for name, stats in cache_stats().items():
+        logger.info("Worker %s cache %s: %s", worker.pid, name, stats)
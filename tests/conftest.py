@@ -0,0 +1,26 @@
+import os
+import sys
+
+import dash
+import pytest
+from dash import html
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DATA_FILES = [
+    os.path.join(ROOT, "data", "heart_processed.csv"),
+    os.path.join(ROOT, "data", "heart_processed.arrow"),
+]
+
+# The components load the processed dataset on import; it is not checked in
+if not any(os.path.exists(path) for path in DATA_FILES):
+    collect_ignore_glob = ["test_*.py"]
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Dash test client; the first app served takes every registered callback."""
+    app = dash.Dash(__name__)
+    app.layout = html.Div()
+    return app.server.test_client()
@@ -0,0 +1,46 @@
+import json
+
+import components.tabs.world_map  # noqa: F401 registers the world-map callbacks
+from components.common.active_tab import refresh_store_id
+
+TITLE_INPUTS = {
+    "year-slider.value": 2000,
+    "metric-dropdown.value": "Death Rate",
+    "gender-dropdown.value": "Both",
+    "map-animation-switch.value": [],
+}
+
+
+def title_request(client, tab_store, refresh=None):
+    dependencies = json.loads(client.get("/_dash-dependencies").data)
+    (dependency,) = [dep for dep in dependencies if dep["output"] == "map-title.children"]
+    values = {**TITLE_INPUTS, f"{refresh_store_id('world-map')}.data": refresh}
+    return {
+        "output": dependency["output"],
+        "outputs": {"id": "map-title", "property": "children"},
+        "inputs": [
+            {**item, "value": values[f"{item['id']}.{item['property']}"]}
+            for item in dependency["inputs"]
+        ],
+        "state": [{"id": "tab-store", "property": "data", "value": tab_store}],
+        "changedPropIds": [],
+    }
+
+
+def test_tab_store_is_read_as_state(client):
+    dependencies = json.loads(client.get("/_dash-dependencies").data)
+    (dependency,) = [dep for dep in dependencies if dep["output"] == "map-title.children"]
+    assert {"id": "tab-store", "property": "data"} not in dependency["inputs"]
+    assert {"id": refresh_store_id("world-map"), "property": "data"} in dependency["inputs"]
+
+
+def test_hidden_tab_skips_its_callbacks(client):
+    body = title_request(client, {"active": "geo-eco", "mounted": ["geo-eco", "world-map"]})
+    assert client.post("/_dash-update-component", json=body).status_code == 204
+
+
+def test_active_tab_runs_its_callbacks(client):
+    body = title_request(client, {"active": "world-map", "mounted": ["world-map"]}, refresh=1)
+    response = client.post("/_dash-update-component", json=body)
+    assert response.status_code == 200
+    assert json.loads(response.data)["response"]["map-title"]["children"] == "Death Rate for 2000 "
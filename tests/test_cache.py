@@ -0,0 +1,39 @@
+import threading
+import time
+
+from components.data.cache import SingleFlightCache, cache_stats
+
+THREADS = 8
+
+
+def test_concurrent_misses_compute_once():
+    cache = SingleFlightCache("test_single_flight", maxsize=4, ttl=60)
+    release = threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("key", compute)))
+        for _ in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    # Let every thread reach the in-flight key before the owner finishes
+    while cache.stats()["misses"] + cache.stats()["stampedes"] < THREADS:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * THREADS
+    assert len(calls) == 1
+    stats = cache_stats()["test_single_flight"]
+    assert stats["misses"] == 1
+    assert stats["stampedes"] == THREADS - 1
+    assert cache.get_or_compute("key", compute) == "value"
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,35 @@
+import polars as pl
+
+from components.data import data as D
+
+
+def region_frame():
+    """A few rows of every region plus one row without a region."""
+    regions = D.UNIQUE_REGIONS + [None]
+    return pl.DataFrame({"region": regions}, schema={"region": D.data.schema["region"]})
+
+
+def test_all_regions_selection_excludes_null_regions():
+    frame = region_frame()
+    selection = D.normalize_selection(D.UNIQUE_REGIONS, D.UNIQUE_REGIONS)
+    assert selection == D.ALL_SELECTED
+
+    selected = frame.filter(D.selection_predicates(regions=D.UNIQUE_REGIONS))
+    expected = frame.filter(pl.col("region").is_in(D.UNIQUE_REGIONS))
+    assert selected.equals(expected)
+    assert selected["region"].null_count() == 0
+
+
+def test_unfiltered_selections_keep_every_row():
+    for regions in (None, [], ["All"]):
+        assert D.normalize_selection(regions, D.UNIQUE_REGIONS) is None
+        assert D.selection_predicates(regions=regions) == []
+
+
+def test_all_regions_query_matches_is_in_filter():
+    year = D.YEAR_RANGE[1]
+    rows = D.filter_data(year=year, regions=D.UNIQUE_REGIONS)
+    expected = D.data.filter(
+        (pl.col("Year") == year) & pl.col("region").is_in(D.UNIQUE_REGIONS)
+    )
+    assert rows.equals(expected)
@@ -0,0 +1,120 @@
+import json
+import time
+
+import pytest
+
+import components.tabs.geo_eco  # noqa: F401 registers the geo-eco warmer
+import components.tabs.healthcare  # noqa: F401 registers the healthcare warmer
+from components.data import prefetch
+from components.data.data import YEAR_RANGE, get_geo_eco_data
+from components.data.figure_cache import FIGURE_CACHE
+from components.tabs.geo_eco import (
+    create_geo_eco_bar,
+    create_geo_eco_histogram,
+    create_geo_eco_scatter,
+)
+
+SELECTION = {
+    "region-dropdown": None,
+    "income-dropdown": None,
+    "gender-dropdown": "Both",
+    "metric-dropdown": "Death Rate",
+    "age-dropdown": "Age-standardized",
+    "country-dropdown": None,
+    "top-filter-slider": 10,
+}
+
+
+def prefetch_dependencies(client):
+    dependencies = json.loads(client.get("/_dash-dependencies").data)
+    slider = [{"id": "year-slider", "property": "value"}]
+    return [dep for dep in dependencies if dep["inputs"] == slider]
+
+
+def slider_moved(dependency, year, tab):
+    values = {
+        "year-slider.min": YEAR_RANGE[0],
+        "year-slider.max": YEAR_RANGE[1],
+        "tab-store.data": {"active": tab, "mounted": [tab]},
+        **{f"{component}.value": value for component, value in SELECTION.items()},
+    }
+    state = [
+        {**item, "value": values[f"{item['id']}.{item['property']}"]}
+        for item in dependency["state"]
+    ]
+    return {
+        "output": dependency["output"],
+        "outputs": [],
+        "inputs": [{"id": "year-slider", "property": "value", "value": year}],
+        "state": state,
+        "changedPropIds": ["year-slider.value"],
+    }
+
+
+class RecordingPrefetcher:
+    def __init__(self):
+        self.jobs = []
+
+    def schedule(self, key, func, *args):
+        self.jobs.append((key, func, args))
+        return True
+
+
+def test_one_prefetch_callback_serves_every_tab(client):
+    assert len(prefetch_dependencies(client)) == 1
+    assert set(prefetch.WARMERS) == {"geo-eco", "healthcare"}
+
+
+@pytest.mark.parametrize("tab", ["geo-eco", "healthcare"])
+def test_each_tab_prefetch_schedules_upcoming_years(client, monkeypatch, tab):
+    recorder = RecordingPrefetcher()
+    monkeypatch.setattr(prefetch, "PREFETCHER", recorder)
+    (dependency,) = prefetch_dependencies(client)
+    year = YEAR_RANGE[0]
+
+    response = client.post("/_dash-update-component", json=slider_moved(dependency, year, tab))
+
+    assert response.status_code in (200, 204)
+    expected = prefetch.upcoming_years(year, *YEAR_RANGE)
+    assert expected
+    assert [args[0] for _, _, args in recorder.jobs] == expected
+    assert all(key[0] == tab and func is prefetch.WARMERS[tab] for key, func, _ in recorder.jobs)
+
+
+def test_inactive_tabs_are_not_prefetched(client, monkeypatch):
+    recorder = RecordingPrefetcher()
+    monkeypatch.setattr(prefetch, "PREFETCHER", recorder)
+    (dependency,) = prefetch_dependencies(client)
+
+    body = slider_moved(dependency, YEAR_RANGE[0], "world-map")
+    client.post("/_dash-update-component", json=body)
+
+    assert recorder.jobs == []
+
+
+def test_prefetched_years_are_served_from_cache(client, monkeypatch):
+    prefetcher = prefetch.Prefetcher(workers=2)
+    monkeypatch.setattr(prefetch, "PREFETCHER", prefetcher)
+    FIGURE_CACHE.clear()
+    (dependency,) = prefetch_dependencies(client)
+    year = YEAR_RANGE[0]
+
+    client.post("/_dash-update-component", json=slider_moved(dependency, year, "geo-eco"))
+    deadline = time.monotonic() + 60
+    while prefetcher.stats()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert prefetcher.stats()["failed"] == 0
+
+    next_year = prefetch.upcoming_years(year, *YEAR_RANGE)[0]
+    before = FIGURE_CACHE.stats()
+    names = ("region", "income", "gender", "metric", "age", "country")
+    regions, income, gender, metric, age, country = (SELECTION[f"{n}-dropdown"] for n in names)
+    top_n = SELECTION["top-filter-slider"]
+    data = get_geo_eco_data(next_year, regions, income, gender, metric, age, country)
+    create_geo_eco_scatter(data, metric, gender, top_n)
+    create_geo_eco_histogram(data, metric, gender)
+    create_geo_eco_bar(data, metric, gender, top_n)
+    after = FIGURE_CACHE.stats()
+
+    assert after["misses"] == before["misses"]
+    assert after["hits"] == before["hits"] + 3
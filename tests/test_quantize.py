@@ -0,0 +1,44 @@
+import json
+
+import numpy as np
+import polars as pl
+
+from components.common.quantize import quantize_frame
+from components.data.store import encode_frame
+
+
+def metric_frame(rows=2000):
+    rng = np.random.default_rng(0)
+    return pl.DataFrame(
+        {
+            "Entity": [f"Country {i % 50}" for i in range(rows)],
+            "valdeathsrateboth": rng.uniform(10, 900, rows),
+            "valprevnumberboth": rng.uniform(1e4, 1e7, rows),
+            "gdp_pc": rng.uniform(500, 90000, rows),
+        }
+    ).with_columns(pl.col(pl.Float64).cast(pl.Float32))
+
+
+def test_quantize_keeps_float32_columns():
+    df = metric_frame()
+    quantized = quantize_frame(df)
+    assert quantized.schema == df.schema
+    assert quantized["valdeathsrateboth"].round_sig_figs(4).equals(quantized["valdeathsrateboth"])
+
+
+def test_quantized_arrow_store_is_smaller():
+    df = metric_frame()
+    for compression in ("zstd", "lz4", "uncompressed"):
+        before = encode_frame(df, "arrow", compression)["data"]
+        after = encode_frame(quantize_frame(df), "arrow", compression)["data"]
+        assert len(after) <= len(before), compression
+    before = encode_frame(df, "arrow", "zstd")["data"]
+    after = encode_frame(quantize_frame(df), "arrow", "zstd")["data"]
+    assert len(after) < len(before)
+
+
+def test_widened_json_store_is_smaller():
+    df = metric_frame()
+    before = json.dumps(encode_frame(df, "columns"))
+    after = json.dumps(encode_frame(quantize_frame(df, widen=True), "columns"))
+    assert len(after) < len(before)
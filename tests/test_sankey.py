@@ -0,0 +1,83 @@
+import pandas as pd
+import polars as pl
+import pytest
+
+from components.common.gender_metric_selector import get_metric_column
+from components.visualisations import create_sankey_diagram, get_title_text
+
+GENDER, METRIC = "Both", "Death Rate"
+COLUMN = get_metric_column(GENDER, METRIC)
+
+
+def sankey_frame(values):
+    regions = ["Africa", "Europe", "Asia"]
+    incomes = ["Low income", "High income"]
+    return pl.DataFrame(
+        {
+            "region": [regions[i % len(regions)] for i in range(len(values))],
+            "WB_Income": [incomes[i % len(incomes)] for i in range(len(values))],
+            COLUMN: [float(value) for value in values],
+        }
+    )
+
+
+def pandas_sankey(df):
+    """Nodes and links as the pandas implementation built them."""
+    df = df.to_pandas()
+    title = get_title_text(COLUMN)
+    try:
+        labels = [f"{title} ({i}%)" for i in ["0-25", "25-50", "50-75", "75-100"]]
+        df["metric_range"] = pd.qcut(df[COLUMN], q=4, labels=labels, duplicates="drop")
+    except ValueError:
+        mean = df[COLUMN].mean()
+        bins = [df[COLUMN].min(), mean / 2, mean, mean * 1.5, df[COLUMN].max()]
+        labels = [f"{title} ({i})" for i in ["Low", "Medium-Low", "Medium-High", "High"]]
+        df["metric_range"] = pd.cut(df[COLUMN], bins=bins, labels=labels, duplicates="drop")
+
+    regions = df["region"].unique().tolist()
+    incomes = df["WB_Income"].unique().tolist()
+    # Rows outside every bin form a NaN node without links; it is not drawn
+    ranges = df["metric_range"].dropna().unique().tolist()
+    nodes = regions + incomes + ranges
+    links = []
+    for region in regions:
+        for income in incomes:
+            count = len(df[(df["region"] == region) & (df["WB_Income"] == income)])
+            if count:
+                links.append((nodes.index(region), nodes.index(income), count))
+    for income in incomes:
+        for range_val in ranges:
+            count = len(df[(df["WB_Income"] == income) & (df["metric_range"] == range_val)])
+            if count:
+                links.append((nodes.index(income), nodes.index(range_val), count))
+    return nodes, links
+
+
+def polars_sankey(df):
+    trace = create_sankey_diagram(df, METRIC, GENDER).figure.data[0]
+    link = trace.link
+    return list(trace.node.label), list(zip(link.source, link.target, link.value))
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12], id="evenly-spread"),
+        pytest.param([1, 1, 1, 1, 2, 3, 4, 5], id="min-equals-q25"),
+        pytest.param([1, 2, 5, 5, 5, 5, 5, 9, 10], id="tied-middle-quartiles"),
+        pytest.param([1, 2, 3, 4, 6, 10, 10, 10, 10], id="q75-equals-max"),
+        pytest.param([2, 3, 3, 3, 3, 3, 3, 20, 30], id="min-left-out-by-cut"),
+    ],
+)
+def test_sankey_matches_pandas_bins(values):
+    df = sankey_frame(values)
+    assert polars_sankey(df) == pandas_sankey(df)
+
+
+def test_sankey_reports_bins_pandas_rejects():
+    # Quartiles tie and the bins around the mean do not increase: pd.cut raised here
+    df = sankey_frame([10, 11, 11, 11, 11, 12])
+    with pytest.raises(ValueError):
+        pandas_sankey(df)
+    trace = create_sankey_diagram(df, METRIC, GENDER).figure
+    assert trace.layout.annotations[0].text == "Not enough distinct values to group into ranges"